@@ -1,13 +1,24 @@
 """
 Encryption utilities for sensitive fields (account numbers, BVN, etc.).
 Uses ONEPIPE_CLIENT_SECRET to derive a Fernet key via SHA256.
+The derived Fernet cipher is cached per secret and reused across calls.
+Uses the Rust-backed `rfernet` when installed (same token format), falling
+back to cryptography's Fernet otherwise.
 Never logs plaintext values.
 """
 import hashlib
 import base64
+from functools import lru_cache
 from django.conf import settings
 from cryptography.fernet import Fernet, InvalidToken
 
+try:
+    import rfernet
+except ImportError:  # optional accelerator
+    rfernet = None
+
+_INVALID_TOKEN_ERRORS = (InvalidToken, rfernet.DecryptionError) if rfernet else (InvalidToken,)
+
 
 def _get_encryption_key():
     """
@@ -18,12 +29,30 @@ def _get_encryption_key():
     if not secret:
         raise ValueError("ONEPIPE_CLIENT_SECRET not configured in settings")
     
+    return _derive_key(secret)
+
+
+@lru_cache(maxsize=8)
+def _derive_key(secret):
+    """SHA256 + base64 urlsafe key derivation, memoized per secret."""
     # Hash the secret with SHA256
     hash_bytes = hashlib.sha256(secret.encode()).digest()
     
     # Base64 urlsafe encode for Fernet compatibility (32 bytes required)
-    key = base64.urlsafe_b64encode(hash_bytes)
-    return key
+    return base64.urlsafe_b64encode(hash_bytes)
+
+
+@lru_cache(maxsize=8)
+def _fernet_for_key(key):
+    """Build the Fernet cipher once per derived key."""
+    if rfernet is not None:
+        return rfernet.Fernet(key.decode())
+    return Fernet(key)
+
+
+def _get_cipher():
+    """Return the cached Fernet cipher for the configured secret."""
+    return _fernet_for_key(_get_encryption_key())
 
 
 def encrypt_value(plaintext):
@@ -43,11 +72,37 @@ def encrypt_value(plaintext):
         return ""
     
     try:
-        key = _get_encryption_key()
-        cipher = Fernet(key)
+        cipher = _get_cipher()
         # Encode plaintext to bytes, encrypt, then decode to string
+        # (rfernet already returns str)
         ciphertext = cipher.encrypt(plaintext.encode())
-        return ciphertext.decode()
+        return ciphertext if isinstance(ciphertext, str) else ciphertext.decode()
+    except Exception as e:
+        raise ValueError(f"Encryption failed: {str(e)}")
+
+
+def encrypt_values(plaintexts):
+    """
+    Encrypt several plaintext strings with one cipher lookup.
+    
+    Same token format as `encrypt_value`; None/empty inputs map to "".
+    
+    Returns:
+        list[str]: Encrypted values in input order
+        
+    Raises:
+        ValueError: If encryption key cannot be derived
+    """
+    try:
+        cipher = _get_cipher()
+        tokens = []
+        for plaintext in plaintexts:
+            if not plaintext:
+                tokens.append("")
+                continue
+            ciphertext = cipher.encrypt(plaintext.encode())
+            tokens.append(ciphertext if isinstance(ciphertext, str) else ciphertext.decode())
+        return tokens
     except Exception as e:
         raise ValueError(f"Encryption failed: {str(e)}")
 
@@ -69,12 +124,11 @@ def decrypt_value(ciphertext):
         return ""
     
     try:
-        key = _get_encryption_key()
-        cipher = Fernet(key)
-        # Decode ciphertext string to bytes, decrypt, then decode to string
-        plaintext = cipher.decrypt(ciphertext.encode())
+        cipher = _get_cipher()
+        # Both implementations accept the token as str; decrypt, then decode to string
+        plaintext = cipher.decrypt(ciphertext)
         return plaintext.decode()
-    except InvalidToken:
+    except _INVALID_TOKEN_ERRORS:
         raise ValueError("Decryption failed: invalid token or corrupted data")
     except Exception as e:
         raise ValueError(f"Decryption failed: {str(e)}")
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_alter_mandate_status_transaction'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profileverificationattempt',
+            index=models.Index(fields=['request_ref'], name='idx_pva_request_ref'),
+        ),
+    ]
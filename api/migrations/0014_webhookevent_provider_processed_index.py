@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_profileverificationattempt_request_ref_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='webhookevent',
+            index=models.Index(fields=['provider', 'processed'], name='idx_webhook_provider_processed'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-15 08:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def deactivate_older_active_rules(apps, schema_editor):
+    """Keep only each user's newest active rule so the constraint can be added.
+
+    The old create path deactivated and inserted outside a transaction, so
+    a user may have been left with more than one active rule.
+    """
+    RulesEngine = apps.get_model('api', 'RulesEngine')
+    keep = {}
+    for rule_id, user_id in (
+        RulesEngine.objects.filter(is_active=True)
+        .order_by('user_id', '-created_at', '-id')
+        .values_list('id', 'user_id')
+    ):
+        keep.setdefault(user_id, rule_id)
+    RulesEngine.objects.filter(is_active=True).exclude(id__in=keep.values()).update(is_active=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_webhookevent_provider_processed_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profileverificationattempt',
+            index=models.Index(fields=['user', '-created_at'], name='idx_pva_user_created'),
+        ),
+        migrations.RunPython(deactivate_older_active_rules, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='rulesengine',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('user',), name='one_active_rule_per_user'),
+        ),
+    ]
@@ -60,6 +60,12 @@ class ProfileVerificationAttempt(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Webhook correlation looks attempts up by request_ref
+            models.Index(fields=["request_ref"], name="idx_pva_request_ref"),
+            # A user's attempts, newest first (default ordering)
+            models.Index(fields=["user", "-created_at"], name="idx_pva_user_created"),
+        ]
 
     def __str__(self):
         return f"VerificationAttempt({self.user.email}, {self.status}, {self.created_at})"
@@ -86,6 +92,10 @@ class WebhookEvent(models.Model):
 
     class Meta:
         ordering = ["-received_at"]
+        indexes = [
+            # Reprocessing picks up unprocessed events per provider
+            models.Index(fields=["provider", "processed"], name="idx_webhook_provider_processed"),
+        ]
 
     def __str__(self):
         return f"WebhookEvent({self.provider}, {self.processed}, {self.received_at})"
@@ -185,6 +195,15 @@ class RulesEngine(models.Model):
         ordering = ["-created_at"]
         verbose_name = "Rules Engine"
         verbose_name_plural = "Rules Engines"
+        constraints = [
+            # Backs clean()'s one-active-rule rule in the database; the partial
+            # unique index also serves get_active_for_user
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(is_active=True),
+                name="one_active_rule_per_user",
+            ),
+        ]
     
     def __str__(self):
         status = "Active" if self.is_active else "Inactive"
@@ -198,8 +217,9 @@ class RulesEngine(models.Model):
         """
         # Check for only one active rule per user
         if self.is_active:
+            # Filter on user_id: self.user would load the user row on every save
             active_rules = RulesEngine.objects.filter(
-                user=self.user,
+                user_id=self.user_id,
                 is_active=True
             ).exclude(pk=self.pk)  # Exclude current instance during updates
             
@@ -3,12 +3,22 @@ OnePipe API client for transact operations.
 Handles request signing, header generation, and response parsing.
 Never logs API keys or secrets.
 """
+import threading
 import uuid
-import hashlib
+from http.cookiejar import DefaultCookiePolicy
 import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from urllib3.util.retry import Retry
 from django.conf import settings
 from decimal import Decimal
-from .triple_des import make_signature, triple_des_encrypt
+from .triple_des import (
+    derive_3des_key,
+    des3_cbc_encrypt_pkcs7,
+    make_signature,
+    make_signature_v2,
+    triple_des_encrypt,
+)
 from .encryption import decrypt_value
 
 
@@ -59,8 +69,6 @@ def build_lookup_accounts_min_payload(
         dict: payload ready to pass to OnePipeClient.transact()
     """
     import base64
-    from Crypto.Cipher import DES3
-    from Crypto.Util.Padding import pad
 
     # Generate a unique request_ref here
     request_ref = uuid.uuid4().hex
@@ -69,19 +77,12 @@ def build_lookup_accounts_min_payload(
     plaintext = f"{account_number};{bank_code}"
     secret_key = settings.ONEPIPE.get("CLIENT_SECRET", "")
     
-    # Key derivation matching Node.js:
+    # Key derivation matching Node.js (derive_3des_key):
     # 1. Convert sharedKey to UTF-16LE bytes
     # 2. MD5 hash the UTF-16LE bytes
     # 3. Concatenate MD5 hash with its first 8 bytes (24 bytes total for 3DES)
-    buffered_key = secret_key.encode('utf-16le')
-    md5_hash = hashlib.md5(buffered_key).digest()  # 16 bytes
-    triple_des_key = md5_hash + md5_hash[:8]  # 24 bytes (16 + 8)
-    
-    # Triple DES-CBC with zero IV
-    iv = bytes(8)  # 8 zero bytes
-    cipher = DES3.new(triple_des_key, DES3.MODE_CBC, iv)
-    padded = pad(plaintext.encode('utf-8'), DES3.block_size)
-    ciphertext = cipher.encrypt(padded)
+    # Triple DES-CBC with zero IV over the UTF-8 plaintext
+    ciphertext = des3_cbc_encrypt_pkcs7(derive_3des_key(secret_key), plaintext.encode('utf-8'))
     # Base64 encode the ciphertext (IV is fixed, not included)
     auth_secure = base64.b64encode(ciphertext).decode()
 
@@ -254,6 +255,35 @@ class OnePipeError(Exception):
         super().__init__(self.message)
 
 
+# One requests.Session per process: views build a fresh OnePipeClient per
+# request, so a per-instance session never got to reuse its connection
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _shared_session():
+    """Return the process-wide requests.Session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                # Every user's calls share this session: refuse provider
+                # cookies so none are replayed on another user's request
+                session.cookies = RequestsCookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+                # Retry only failed connects (nothing was sent); transact POSTs
+                # move money, so read/status failures are never replayed
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
 class OnePipeClient:
     """Client for OnePipe PayWithAccount API"""
 
@@ -263,6 +293,8 @@ class OnePipeClient:
         self.transact_path = self.config.get("TRANSACT_PATH", "/v2/transact")
         self.api_key = self.config.get("API_KEY")
         self.client_secret = self.config.get("CLIENT_SECRET")
+        # "md5" is the OnePipe wire format; "blake2b" only where the endpoint supports it
+        self.signature_alg = self.config.get("SIGNATURE_ALG", "md5")
 
         if not self.api_key or not self.client_secret:
             raise ValueError("ONEPIPE configuration missing: API_KEY and CLIENT_SECRET required in settings.ONEPIPE")
@@ -273,10 +305,13 @@ class OnePipeClient:
 
     def _generate_signature(self, request_ref):
         """
-        Generate MD5 signature from request_ref and client_secret.
-        Format: MD5(request_ref;client_secret)
+        Generate signature from request_ref and client_secret.
+        Format: MD5(request_ref;client_secret), or BLAKE2b-128 of the same
+        buffer when ONEPIPE["SIGNATURE_ALG"] is "blake2b".
         """
         # Use shared helper to ensure consistent UTF-8 encoding and lowercase
+        if self.signature_alg == "blake2b":
+            return make_signature_v2(request_ref, self.client_secret)
         return make_signature(request_ref, self.client_secret)
 
     def _build_headers(self, request_ref):
@@ -318,7 +353,7 @@ class OnePipeClient:
         headers = self._build_headers(request_ref)
 
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = _shared_session().post(url, json=payload, headers=headers, timeout=30)
         except requests.exceptions.RequestException as e:
             raise OnePipeError(
                 status_code=None,
@@ -0,0 +1,66 @@
+"""
+JSON parser backed by orjson.
+
+Falls back to DRF's stdlib-json JSONParser when orjson is not installed, the
+request body is not UTF-8, or the body holds a run of 20 or more digits:
+orjson decodes integers beyond 64 bits as floats, losing precision, where the
+stdlib keeps them exact. `loads` is the same choice for views that read
+request.body directly.
+"""
+
+import codecs
+import io
+import json
+import re
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; use DRF's stdlib json path
+    orjson = None
+
+
+# Any integer too big for 64 bits has at least 20 digits
+_LONG_DIGIT_RUN = re.compile(rb"[0-9]{20}")
+
+
+def _may_hold_big_int(data):
+    if isinstance(data, str):
+        data = data.encode()
+    return _LONG_DIGIT_RUN.search(data) is not None
+
+
+def loads(data):
+    """Decode a JSON document from bytes/str; raises ValueError on bad input."""
+    if orjson is not None and not _may_hold_big_int(data):
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_utf8(encoding):
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+class ORJSONParser(JSONParser):
+    """Parse UTF-8 JSON request bodies with orjson."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or not _is_utf8(encoding):
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if _may_hold_big_int(body):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,70 @@
+"""
+JSON renderer backed by orjson.
+
+Falls back to DRF's stdlib-json JSONRenderer when orjson is not installed,
+when the client asks for indented output, and for data orjson would encode
+differently: integers beyond 64 bits (orjson refuses them) and NaN/Infinity
+(orjson writes null where DRF raises or writes NaN). Output is the same as
+JSONRenderer for the data DRF serializers normally produce; the renderer
+tests compare the two directly.
+"""
+
+import math
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; use DRF's stdlib json path
+    orjson = None
+
+
+# DRF always escapes these so the output is a strict JavaScript subset
+_LINE_SEPARATORS = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"))
+
+
+def _has_non_finite_float(obj):
+    """True if `obj` (nested dicts/lists) holds NaN or +/-Infinity."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in obj)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Render compact UTF-8 JSON with orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b""
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Hand datetimes and anything orjson can't encode (Decimal, lazy
+        # strings, ...) to DRF's encoder so the output matches JSONRenderer
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. an int beyond 64 bits, which the stdlib encoder handles
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson writes NaN/Infinity as null; only then is the data walked,
+        # so DRF can raise (or write NaN) exactly as JSONRenderer would
+        if b"null" in ret and _has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for raw, escaped in _LINE_SEPARATORS:
+            if raw in ret:
+                ret = ret.replace(raw, escaped)
+        return ret
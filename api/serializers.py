@@ -3,13 +3,37 @@ from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from datetime import date
+from django.db import transaction
+from django.db.models.fields.json import KT
 from .models import RulesEngine, Mandate, Profile
+import copy
 import uuid
 import re
 
 
+class CachedFieldsMixin:
+    """Build a ModelSerializer's fields once per class and hand out copies.
+
+    ModelSerializer.get_fields() introspects the model and deep-copies every
+    field on each instantiation. The unbound fields are the same every time,
+    so they are built once per class and shallow-copied; bind() then sets
+    field_name/parent on the copy only. Only for serializers whose fields do
+    not depend on the instance or context and hold no nested serializers or
+    ListField children (those keep a reference to their parent).
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # Per concrete class: subclasses may change Meta
+        fields = cls.__dict__.get("_cached_fields")
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return {name: copy.copy(field) for name, field in fields.items()}
+
+
 class UserSerializer(serializers.ModelSerializer):
-    """Serializer for returning user data"""
+    """Serializer for returning user data (mirrored by views._user_payload)"""
     name = serializers.CharField(source="first_name", read_only=True)
 
     class Meta:
@@ -176,21 +200,26 @@ class BankInfoSerializer(serializers.Serializer):
         bank_name = self.validated_data.get("bank_name")
         bank_code = self.validated_data.get("bank_code")
 
-        # Encrypt sensitive fields
+        # Encrypt sensitive fields; only the columns touched here are written
+        update_fields = ["updated_at"]
         if account_number:
             profile.account_number_encrypted = encrypt_value(account_number)
+            update_fields.append("account_number_encrypted")
         if bvn:
             profile.bvn_encrypted = encrypt_value(bvn)
+            update_fields.append("bvn_encrypted")
         if bank_name:
             profile.bank_name = bank_name
+            update_fields.append("bank_name")
         if bank_code:
             profile.bank_code = bank_code
+            update_fields.append("bank_code")
 
-        profile.save()
+        profile.save(update_fields=update_fields)
         return profile
 
 
-class RulesEngineSerializer(serializers.ModelSerializer):
+class RulesEngineSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for creating and updating debit rules.
     
@@ -221,6 +250,10 @@ class RulesEngineSerializer(serializers.ModelSerializer):
             "updated_at",
         )
         read_only_fields = ("id", "is_active", "created_at", "updated_at")
+        # No UniqueTogetherValidator for one_active_rule_per_user: create()
+        # deactivates the previous rule before inserting, so a user with an
+        # active rule must still validate
+        validators = []
     
     def validate_monthly_max_debit(self, value):
         """Validate monthly_max_debit is positive"""
@@ -308,13 +341,16 @@ class RulesEngineSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("User must be authenticated to create rules.")
         
         user = request.user
-        
-        # Deactivate any existing active rules for this user
-        RulesEngine.objects.filter(user=user, is_active=True).update(is_active=False)
-        
-        # Create the new rule with the user attached
         validated_data["user"] = user
-        return super().create(validated_data)
+
+        # Deactivate-then-create commits together: a failed INSERT must not
+        # leave the user with no active rule (one_active_rule_per_user)
+        with transaction.atomic():
+            # Deactivate any existing active rules for this user (one UPDATE)
+            RulesEngine.objects.filter(user=user, is_active=True).update(is_active=False)
+
+            # Create the new rule with the user attached
+            return super().create(validated_data)
 
 
 class RulesEngineUpdateSerializer(RulesEngineSerializer):
@@ -352,7 +388,7 @@ class RulesEngineDisableSerializer(serializers.Serializer):
 
     def update(self, instance, validated_data):
         instance.is_active = False
-        instance.save()
+        instance.save(update_fields=["is_active", "updated_at"])
         return instance
 
     def create(self, validated_data):
@@ -493,7 +529,12 @@ class CancelMandateSerializer(serializers.Serializer):
         return data
 
 
-class MandateSerializer(serializers.ModelSerializer):
+# Unbound field used only to format datetimes the way DRF would (current
+# timezone, ISO 8601 with a trailing "Z" for UTC); see MandateSerializer
+_DATETIME_FIELD = serializers.DateTimeField()
+
+
+class MandateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for reading mandate details (GET endpoints).
     
     Returns mandate status, identifiers, and timestamps.
@@ -518,11 +559,46 @@ class MandateSerializer(serializers.ModelSerializer):
         )
         read_only_fields = fields
     
+    @classmethod
+    def with_response_codes(cls, queryset):
+        """Load only the serialized columns, extracting the response codes in SQL."""
+        columns = [name for name in cls.Meta.fields if name != "provider_response_code"]
+        return queryset.only(*columns).annotate(
+            cancel_response_code=KT("cancel_response__data__provider_response_code"),
+            provider_response_code_value=KT("provider_response__data__provider_response_code"),
+        )
+
+    def to_representation(self, obj):
+        """Build the read-only payload directly instead of dispatching per field.
+
+        Every field is a plain model attribute, so this returns the same dict
+        as ModelSerializer without get_attribute/to_representation per field.
+        """
+        to_datetime = _DATETIME_FIELD.to_representation
+        subscription_id = obj.subscription_id
+        cancelled_at = obj.cancelled_at
+        return {
+            "id": obj.id,
+            "status": obj.status,
+            "mandate_reference": obj.mandate_reference,
+            "subscription_id": None if subscription_id is None else int(subscription_id),
+            "request_ref": obj.request_ref,
+            "activation_url": obj.activation_url,
+            "created_at": to_datetime(obj.created_at),
+            "cancelled_at": None if cancelled_at is None else to_datetime(cancelled_at),
+            "provider_response_code": self.get_provider_response_code(obj),
+        }
+
     def get_provider_response_code(self, obj):
         """Extract provider response code from last stored responses.
         
         Try cancel_response first (if available), then provider_response.
+        Querysets from `with_response_codes()` carry both codes as annotations,
+        so the JSON columns themselves need not be loaded.
         """
+        if hasattr(obj, "cancel_response_code"):
+            return obj.cancel_response_code or obj.provider_response_code_value or None
+
         # Check cancel_response
         cancel_resp = getattr(obj, "cancel_response", None)
         if isinstance(cancel_resp, dict):
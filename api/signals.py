@@ -27,13 +27,23 @@ def create_profile(sender, instance, created, **kwargs):
     - API signup always has a Profile ready
     - Any other User creation path (CLI, scripts, etc.) gets a Profile
     - If Profile already exists, get_or_create prevents duplicates
+
+    A freshly inserted User cannot have a Profile yet, so the normal path is a
+    single INSERT. Fixture loads (raw=True) may bring their own Profile rows
+    and keep the get_or_create check.
     """
     if created:
         from .models import Profile
-        profile, created_profile = Profile.objects.get_or_create(
-            user=instance,
-            defaults={"first_name": instance.first_name}
-        )
+        if kwargs.get("raw"):
+            profile, created_profile = Profile.objects.get_or_create(
+                user=instance,
+                defaults={"first_name": instance.first_name}
+            )
+        else:
+            profile = Profile.objects.create(user=instance, first_name=instance.first_name)
+            created_profile = True
+        # Cache on the instance so user.profile does not re-query
+        instance.profile = profile
         if created_profile:
             logger.info(f"Profile auto-created for user: {instance.username}")
 
@@ -3,7 +3,7 @@ from django.test import TestCase
 from rest_framework.test import APITestCase
 from rest_framework import status
 from unittest.mock import patch, MagicMock
-from django.core.cache import cache
+from api.views import _BANKS_CACHE, BanksView
 
 
 class BanksEndpointTestCase(APITestCase):
@@ -11,11 +11,11 @@ class BanksEndpointTestCase(APITestCase):
 
     def setUp(self):
         """Clear cache before each test"""
-        cache.clear()
+        _BANKS_CACHE.update(body=None, ts=0)
 
     def tearDown(self):
         """Clear cache after each test"""
-        cache.clear()
+        _BANKS_CACHE.update(body=None, ts=0)
 
     def test_banks_endpoint_no_auth_required(self):
         """GET /api/banks/ should work without authentication"""
@@ -150,8 +150,8 @@ class BanksEndpointTestCase(APITestCase):
         self.assertEqual(response1.json(), response2.json())
 
     @patch('api.views.OnePipeClient.transact')
-    def test_banks_endpoint_returns_502_on_provider_error(self, mock_transact):
-        """Should return 502 BAD_GATEWAY when provider returns no banks"""
+    def test_banks_endpoint_falls_back_on_provider_error(self, mock_transact):
+        """Should serve FALLBACK_BANKS, cached for an hour, when provider returns no banks"""
         mock_transact.return_value = {
             'response': {
                 'data': {}  # No banks in response
@@ -159,14 +159,17 @@ class BanksEndpointTestCase(APITestCase):
         }
 
         response = self.client.get('/api/banks/', format='json')
-        self.assertEqual(response.status_code, status.HTTP_502_BAD_GATEWAY)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), BanksView.FALLBACK_BANKS)
 
-        data = response.json()
-        self.assertIn('error', data)
+        # Still served from cache a minute before the hour is up
+        _BANKS_CACHE['ts'] -= BanksView.CACHE_TIMEOUT - 60
+        self.client.get('/api/banks/', format='json')
+        self.assertEqual(mock_transact.call_count, 1)
 
     @patch('api.views.OnePipeClient.transact')
     def test_banks_endpoint_handles_empty_banks_list(self, mock_transact):
-        """Should handle empty banks list gracefully"""
+        """Should serve FALLBACK_BANKS when provider returns an empty list"""
         mock_transact.return_value = {
             'response': {
                 'data': {
@@ -176,7 +179,8 @@ class BanksEndpointTestCase(APITestCase):
         }
 
         response = self.client.get('/api/banks/', format='json')
-        self.assertEqual(response.status_code, status.HTTP_502_BAD_GATEWAY)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), BanksView.FALLBACK_BANKS)
 
     @patch('api.views.OnePipeClient.transact')
     def test_banks_uses_alternative_field_names(self, mock_transact):
@@ -66,8 +66,9 @@ class GetMandateTestCase(APITestCase):
         # Login
         self.client.force_authenticate(user=self.user)
 
-        # GET /api/mandates/me/
-        response = self.client.get("/api/mandates/me/")
+        # GET /api/mandates/me/ - one SELECT, no deferred-field reloads
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/mandates/me/")
 
         # Verify 200 and fields
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -82,6 +83,64 @@ class GetMandateTestCase(APITestCase):
         self.assertIsNone(data["cancelled_at"])
         self.assertEqual(data["provider_response_code"], "00")
 
+    def test_mandate_serializer_matches_field_by_field_output(self):
+        """Hand-built to_representation returns what ModelSerializer would"""
+        from django.utils import timezone
+        from rest_framework import serializers
+        from .serializers import MandateSerializer
+
+        class FieldByField(serializers.ModelSerializer):
+            provider_response_code = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Mandate
+                fields = MandateSerializer.Meta.fields
+
+            def get_provider_response_code(self, obj):
+                return MandateSerializer().get_provider_response_code(obj)
+
+        full = Mandate.objects.create(
+            user=self.user,
+            rules_engine=self.rules_engine,
+            status="CANCELLED",
+            request_ref="test-request-ref-repr",
+            mandate_reference="mandate-ref-repr",
+            subscription_id=42,
+            activation_url="https://example.com/activate",
+            cancelled_at=timezone.now(),
+            cancel_response={"data": {"provider_response_code": "00"}},
+        )
+        bare = Mandate.objects.create(
+            user=self.user,
+            rules_engine=self.rules_engine,
+            status="PENDING",
+            request_ref="test-request-ref-bare",
+        )
+
+        for mandate in (full, bare):
+            self.assertEqual(
+                MandateSerializer(mandate).data, FieldByField(mandate).data
+            )
+
+    def test_each_poll_reads_the_current_mandate(self):
+        """Every GET runs its one SELECT, so a poll sees writes made since the last"""
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get("/api/mandates/me/").status_code, status.HTTP_404_NOT_FOUND)
+
+        mandate = Mandate.objects.create(
+            user=self.user,
+            rules_engine=self.rules_engine,
+            status="PENDING",
+            request_ref="test-request-ref-poll",
+        )
+        self.assertEqual(self.client.get("/api/mandates/me/").data["status"], "PENDING")
+
+        # A queryset update sends no signals; the next poll still sees it
+        Mandate.objects.filter(pk=mandate.pk).update(status="ACTIVE")
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/mandates/me/")
+        self.assertEqual(response.data["status"], "ACTIVE")
+
     def test_get_mandate_returns_latest_when_multiple(self):
         """When user has multiple mandates, returns the latest (by created_at)"""
         # Create first mandate
@@ -0,0 +1,48 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from .utils.inflight import coalesce
+
+
+class CoalesceTests(SimpleTestCase):
+    def test_concurrent_callers_share_one_call(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_call():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"status": "Successful"}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(coalesce("k", slow_call)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(coalesce("k", slow_call)))
+        follower.start()
+        # Give the follower time to block on the leader's future
+        time.sleep(0.1)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"status": "Successful"}] * 2)
+
+    def test_sequential_calls_run_again(self):
+        calls = []
+        coalesce("seq", lambda: calls.append(1))
+        coalesce("seq", lambda: calls.append(1))
+        self.assertEqual(len(calls), 2)
+
+    def test_exception_propagates_and_clears_entry(self):
+        def boom():
+            raise ValueError("provider down")
+
+        with self.assertRaises(ValueError):
+            coalesce("err", boom)
+        self.assertEqual(coalesce("err", lambda: "ok"), "ok")
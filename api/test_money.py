@@ -15,3 +15,8 @@ class MoneyUtilsTests(SimpleTestCase):
         self.assertEqual(to_onepipe_amount(Decimal('100.25')), '100250')
         # small fractional values
         self.assertEqual(to_onepipe_amount('0.001'), '1')
+
+    def test_to_onepipe_amount_whole_decimal_forms(self):
+        # exponent >= 0 takes the integer fast path; trailing-zero scale does not
+        self.assertEqual(to_onepipe_amount(Decimal('1E+3')), '1000000')
+        self.assertEqual(to_onepipe_amount(Decimal('100.00')), '100000')
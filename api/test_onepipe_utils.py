@@ -1,6 +1,11 @@
 from django.test import SimpleTestCase
 
-from .utils.onepipe_utils import extract_activation_url, extract_provider_transaction_ref
+from .utils.onepipe_utils import (
+    extract_activation_url,
+    extract_mandate_fields,
+    extract_provider_transaction_ref,
+    first_truthy,
+)
 
 
 class OnePipeUtilsTests(SimpleTestCase):
@@ -39,3 +44,47 @@ class OnePipeUtilsTests(SimpleTestCase):
     def test_extract_tx_ref_missing(self):
         resp = {"data": {"nothing": "here"}}
         self.assertIsNone(extract_provider_transaction_ref(resp))
+
+    def test_extract_mandate_fields_from_provider_response(self):
+        resp = {
+            "status": "Successful",
+            "data": {
+                "authorization_url": "https://pay/authorize",
+                "tx_ref": "tx-789",
+                "provider_response": {
+                    "mandate_reference": "mr-1",
+                    "status": "ACTIVE",
+                    "meta": {"subscription_id": 42},
+                },
+            },
+        }
+        self.assertEqual(
+            extract_mandate_fields(resp),
+            {
+                "activation_url": "https://pay/authorize",
+                "transaction_ref": "tx-789",
+                "mandate_reference": "mr-1",
+                "subscription_id": 42,
+                "provider_status": "ACTIVE",
+            },
+        )
+
+    def test_extract_mandate_fields_defaults(self):
+        expected = {
+            "activation_url": "",
+            "transaction_ref": "",
+            "mandate_reference": None,
+            "subscription_id": None,
+            "provider_status": None,
+        }
+        for resp in (None, "oops", {"data": None}, {"data": "x"}, {"data": {"provider_response": {"meta": "x"}}}):
+            self.assertEqual(extract_mandate_fields(resp), expected)
+
+    def test_extract_mandate_fields_top_level_when_data_empty(self):
+        fields = extract_mandate_fields({"data": {}, "url": "https://top/url"})
+        self.assertEqual(fields["activation_url"], "https://top/url")
+
+    def test_first_truthy_skips_empty_values_in_key_order(self):
+        bank = {"bank_name": "", "name": "Access Bank", "bank": "ACCESS"}
+        self.assertEqual(first_truthy(bank, ("bank_name", "name", "bank")), "Access Bank")
+        self.assertIsNone(first_truthy(bank, ("code", "bank_code")))
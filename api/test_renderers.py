@@ -0,0 +1,69 @@
+import io
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from .parsers import ORJSONParser, loads
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_output_matches_drf_json_renderer(self):
+        data = {
+            "amount": Decimal("100.25"),
+            "created_at": datetime(2026, 2, 1, 15, 3, 4, 123456, tzinfo=timezone.utc),
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "name": "Adébáyọ̀\u2028",
+            "items": [1, 2.5, None, True],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_integer_beyond_64_bits_renders_like_drf(self):
+        data = {"amount": 2 ** 70, "small": 1}
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_nan_raises_like_drf(self):
+        data = {"rate": [1.5, float("nan")], "note": None}
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(data)
+        with self.assertRaises(ValueError):
+            ORJSONRenderer().render(data)
+
+    def test_indent_request_uses_drf_path(self):
+        data = {"a": 1}
+        media_type = "application/json; indent=2"
+        self.assertEqual(
+            ORJSONRenderer().render(data, media_type, {}),
+            JSONRenderer().render(data, media_type, {}),
+        )
+
+
+class ORJSONParserTests(SimpleTestCase):
+    def test_parses_like_drf_json_parser(self):
+        body = '{"request_ref": "abc", "data": {"amount": 1.5, "ok": true}}'.encode()
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(body)),
+            JSONParser().parse(io.BytesIO(body)),
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b"{not json"))
+
+    def test_integer_beyond_64_bits_stays_exact(self):
+        body = b'{"amount": 123456789012345678901234567890}'
+        parsed = ORJSONParser().parse(io.BytesIO(body))
+        self.assertEqual(parsed, {"amount": 123456789012345678901234567890})
+        self.assertEqual(parsed, JSONParser().parse(io.BytesIO(body)))
+
+    def test_loads_keeps_integer_beyond_64_bits_exact(self):
+        self.assertEqual(loads(b"[18446744073709551617]"), [18446744073709551617])
+        self.assertEqual(loads("[18446744073709551617]"), [18446744073709551617])
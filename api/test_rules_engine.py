@@ -0,0 +1,119 @@
+"""
+Tests for the GET /api/rules-engine/me/ endpoint and RulesEngineSerializer.
+"""
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import RulesEngine
+from .serializers import RulesEngineSerializer, RulesEngineUpdateSerializer
+from .views import _active_rule
+
+
+class ActiveRuleTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="rules@example.com", email="rules@example.com")
+        cls.rule = RulesEngine.objects.create(
+            user=cls.user,
+            monthly_max_debit=Decimal("50000"),
+            single_max_debit=Decimal("10000"),
+            frequency="MONTHLY",
+            amount_per_frequency=Decimal("50000"),
+            failure_action="NOTIFY",
+            start_date=date.today(),
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+    def test_active_rule_is_looked_up_once_per_request(self):
+        request = SimpleNamespace(user=self.user)
+        with self.assertNumQueries(1):
+            self.assertEqual(_active_rule(request), self.rule)
+            self.assertEqual(_active_rule(request), self.rule)
+
+    def test_each_get_reads_the_current_rule(self):
+        self.client.get("/api/rules-engine/me/")
+        # A queryset update sends no signals; the next request still sees it
+        RulesEngine.objects.filter(pk=self.rule.pk).update(failure_action="RETRY")
+
+        self.assertEqual(self.client.get("/api/rules-engine/me/").data["failure_action"], "RETRY")
+
+    def test_get_after_disable_returns_404(self):
+        self.client.get("/api/rules-engine/me/")
+        self.client.post("/api/rules-engine/me/disable/")
+
+        self.assertEqual(self.client.get("/api/rules-engine/me/").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_database_rejects_second_active_rule(self):
+        duplicate = RulesEngine(
+            user=self.user,
+            monthly_max_debit=Decimal("1000"),
+            single_max_debit=Decimal("100"),
+            frequency="MONTHLY",
+            amount_per_frequency=Decimal("1000"),
+            failure_action="NOTIFY",
+            start_date=date.today(),
+        )
+        # bulk_create skips clean(); the partial unique constraint still holds
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            RulesEngine.objects.bulk_create([duplicate])
+
+    def test_cached_serializer_fields_are_bound_per_instance(self):
+        first, second = RulesEngineSerializer(), RulesEngineSerializer()
+        self.assertIsNot(first.fields["frequency"], second.fields["frequency"])
+        self.assertIs(first.fields["frequency"].parent, first)
+        self.assertIs(second.fields["frequency"].parent, second)
+        # Subclasses with a different Meta keep their own field set
+        self.assertFalse(RulesEngineSerializer().fields["user"].read_only)
+        self.assertTrue(RulesEngineUpdateSerializer().fields["user"].read_only)
+        update = RulesEngineUpdateSerializer()
+        self.assertIsNot(update.fields["frequency"], first.fields["frequency"])
+        self.assertIs(update.fields["frequency"].parent, update)
+
+    def second_rule_serializer(self):
+        return RulesEngineSerializer(
+            data={
+                "user": self.user.pk,
+                "monthly_max_debit": "30000.00",
+                "single_max_debit": "5000.00",
+                "frequency": "WEEKLY",
+                "amount_per_frequency": "5000.00",
+                "allocations": [{"bucket": "SAVINGS", "percentage": 100}],
+                "failure_action": "SKIP",
+                "start_date": str(date.today()),
+            },
+            context={"request": SimpleNamespace(user=self.user)},
+        )
+
+    def test_second_create_deactivates_previous_rule(self):
+        serializer = self.second_rule_serializer()
+        # A user with an active rule still validates; create() swaps it out
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        # SAVEPOINT, deactivating UPDATE, clean()'s active-rule EXISTS, INSERT, RELEASE
+        with self.assertNumQueries(5):
+            new_rule = serializer.save()
+
+        self.rule.refresh_from_db()
+        self.assertFalse(self.rule.is_active)
+        self.assertEqual(RulesEngine.get_active_for_user(self.user), new_rule)
+
+    def test_failed_create_keeps_previous_rule_active(self):
+        serializer = self.second_rule_serializer()
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        # The deactivating UPDATE is rolled back along with the failed INSERT
+        with patch.object(RulesEngine.objects, "create", side_effect=IntegrityError), \
+                self.assertRaises(IntegrityError):
+            serializer.save()
+
+        self.rule.refresh_from_db()
+        self.assertTrue(self.rule.is_active)
@@ -14,14 +14,36 @@ Must match Java implementation for:
 
 import hashlib
 import base64
-from Crypto.Cipher import DES3
-from Crypto.Util.Padding import pad
+from functools import lru_cache
+from cryptography.hazmat.primitives.ciphers import Cipher, modes
+from cryptography.hazmat.primitives.padding import PKCS7
 
+try:
+    from cryptography.hazmat.decrepit.ciphers.algorithms import TripleDES
+except ImportError:  # cryptography < 43
+    from cryptography.hazmat.primitives.ciphers.algorithms import TripleDES
 
+# DESede/CBC with an 8-byte zero IV, as in the Java reference implementation
+_ZERO_IV = b'\x00' * 8
+
+
+@lru_cache(maxsize=8)
+def _cipher(key: bytes) -> Cipher:
+    """OpenSSL-backed TripleDES/CBC cipher for the given 24-byte key.
+
+    The IV is fixed, so the Cipher is immutable and built once per key; each
+    call site still takes a fresh encryptor()/decryptor() context from it.
+    """
+    return Cipher(TripleDES(key), modes.CBC(_ZERO_IV))
+
+
+@lru_cache(maxsize=8)
 def derive_3des_key(secret: str) -> bytes:
     """
     Derive a 24-byte TripleDES key from a secret string.
     
+    Memoized per secret: the client secret is a process-wide constant.
+    
     Process (matches Java):
     1. Encode secret as UTF-16LE bytes
     2. Compute MD5 hash of those bytes
@@ -46,6 +68,22 @@ def derive_3des_key(secret: str) -> bytes:
     return key_24
 
 
+def des3_cbc_encrypt_pkcs7(key: bytes, plaintext_bytes: bytes) -> bytes:
+    """
+    PKCS7-pad and TripleDES/CBC-encrypt raw bytes under a derived key (zero IV).
+    
+    The byte-level core shared by triple_des_encrypt (UTF-16LE text) and
+    callers that encode their plaintext differently.
+    """
+    # PKCS5 (same as PKCS7 for 8-byte blocks): append n copies of byte n
+    n = 8 - (len(plaintext_bytes) & 7)
+    padded = plaintext_bytes + bytes((n,)) * n
+    
+    # One encryptor context per call from the cached per-key Cipher
+    encryptor = _cipher(key).encryptor()
+    return encryptor.update(padded) + encryptor.finalize()
+
+
 def triple_des_encrypt(plaintext: str, secret: str) -> str:
     """
     Encrypt plaintext using TripleDES/CBC/PKCS5Padding.
@@ -79,15 +117,8 @@ def triple_des_encrypt(plaintext: str, secret: str) -> str:
     # Derive key
     key = derive_3des_key(secret)
     
-    # Create cipher with 8-byte zero IV
-    iv = b'\x00' * 8
-    cipher = DES3.new(key, DES3.MODE_CBC, iv)
-    
-    # Pad plaintext (PKCS5 is same as PKCS7 for 8-byte blocks)
-    padded = pad(plaintext_bytes, 8, style='pkcs7')
-    
-    # Encrypt
-    ciphertext = cipher.encrypt(padded)
+    # Pad and encrypt
+    ciphertext = des3_cbc_encrypt_pkcs7(key, plaintext_bytes)
     
     # Return base64
     return base64.b64encode(ciphertext).decode('ascii')
@@ -104,8 +135,6 @@ def triple_des_decrypt(ciphertext_b64: str, secret: str) -> str:
     Returns:
         Decrypted plaintext string
     """
-    from Crypto.Util.Padding import unpad
-    
     if not ciphertext_b64:
         raise ValueError("Ciphertext cannot be empty")
     if not secret:
@@ -117,15 +146,11 @@ def triple_des_decrypt(ciphertext_b64: str, secret: str) -> str:
     # Derive key
     key = derive_3des_key(secret)
     
-    # Create cipher with 8-byte zero IV
-    iv = b'\x00' * 8
-    cipher = DES3.new(key, DES3.MODE_CBC, iv)
-    
-    # Decrypt
-    padded_plaintext = cipher.decrypt(ciphertext)
-    
-    # Unpad
-    plaintext_bytes = unpad(padded_plaintext, 8, style='pkcs7')
+    # Decrypt and unpad
+    decryptor = _cipher(key).decryptor()
+    padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+    unpadder = PKCS7(64).unpadder()
+    plaintext_bytes = unpadder.update(padded_plaintext) + unpadder.finalize()
     
     # Decode UTF-16LE
     return plaintext_bytes.decode('utf-16-le')
@@ -140,5 +165,21 @@ def make_signature(request_ref: str, client_secret: str) -> str:
     if request_ref is None or client_secret is None:
         raise ValueError("request_ref and client_secret must be provided")
 
-    to_hash = f"{request_ref};{client_secret}".encode("utf-8")
-    return hashlib.md5(to_hash).hexdigest().lower()
+    buf = request_ref.encode("utf-8") + b";" + client_secret.encode("utf-8")
+    # MD5 is mandated by the OnePipe wire format, not used for security here;
+    # hexdigest() is already lowercase
+    return hashlib.md5(buf, usedforsecurity=False).hexdigest()
+
+
+def make_signature_v2(request_ref: str, client_secret: str) -> str:
+    """
+    BLAKE2b-128 variant of make_signature over the same "{request_ref};{client_secret}" buffer.
+
+    Only for endpoints that accept it (ONEPIPE["SIGNATURE_ALG"] = "blake2b");
+    the OnePipe default wire format is MD5.
+    """
+    if request_ref is None or client_secret is None:
+        raise ValueError("request_ref and client_secret must be provided")
+
+    buf = request_ref.encode("utf-8") + b";" + client_secret.encode("utf-8")
+    return hashlib.blake2b(buf, digest_size=16, usedforsecurity=False).hexdigest()
@@ -23,7 +23,7 @@ from .views import (
 
 app_name = 'api'
 
-urlpatterns = [
+urlpatterns = (
     path('', HomeView.as_view(), name='home'),
     path('services/', ServicesView.as_view(), name='services'),
     path('token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
@@ -45,4 +45,4 @@ urlpatterns = [
     path('mandates/create/', MandateCreateView.as_view(), name='mandate_create'),
     path('mandates/me/', MandatesMeView.as_view(), name='mandates_me'),
     path('mandates/cancel/', CancelMandateView.as_view(), name='mandate_cancel'),
-]
+)
@@ -0,0 +1,37 @@
+import threading
+from concurrent.futures import Future
+
+
+# In-process registry of calls currently running, keyed by caller-chosen keys
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def coalesce(key, fn, timeout=60):
+    """Run `fn()` once for concurrent callers sharing `key`.
+
+    The first caller executes `fn`; callers arriving while it is still running
+    wait for and receive the same result (or exception). The entry is removed
+    as soon as the call finishes, so later calls run `fn` again.
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _INFLIGHT[key] = future
+
+    if not leader:
+        return future.result(timeout=timeout)
+
+    try:
+        result = fn()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 
 
 def to_onepipe_amount(naira_decimal) -> str:
@@ -11,8 +12,21 @@ def to_onepipe_amount(naira_decimal) -> str:
         to_onepipe_amount(Decimal('100000')) -> '100000000'
         to_onepipe_amount('100.25') -> '100250'
     """
-    # Use string conversion to avoid binary float surprises
-    dec = Decimal(str(naira_decimal))
+    # Whole-naira fast path: plain integer math, no Decimal arithmetic
+    if type(naira_decimal) is int:
+        return str(naira_decimal * 1000)
+    if isinstance(naira_decimal, Decimal) and naira_decimal.is_finite() and naira_decimal.as_tuple().exponent >= 0:
+        return str(int(naira_decimal) * 1000)
+
+    # Use string conversion to avoid binary float surprises; the string form
+    # also normalizes Decimal/str/int inputs onto a single cache key.
+    return _to_onepipe_amount_cached(str(naira_decimal))
+
+
+@lru_cache(maxsize=1024)
+def _to_onepipe_amount_cached(naira_str: str) -> str:
+    """Memoized conversion keyed on the string form of the amount."""
+    dec = Decimal(naira_str)
     result = dec * Decimal(1000)
     # Render without exponent and strip trailing zeros from fractional part
     s = format(result, 'f')
@@ -1,91 +1,125 @@
 from typing import Optional
 
 
-def extract_activation_url(provider_response: dict) -> Optional[str]:
-    """Extract an activation/authorization URL from common provider response shapes.
+# Key paths probed in priority order by the extractors below
+_ACTIVATION_URL_PATHS = (
+    ("data", "activation_url"),
+    ("activation_url",),
+    ("data", "url"),
+    ("data", "meta", "activation_url"),
+)
+
+# Keys probed under `data` first, then at the top level
+_TX_REF_KEYS = ("transaction_ref", "tx_ref", "transactionId", "transaction_id")
+_PAYMENT_ID_KEYS = ("payment_id", "paymentId", "payment_reference")
+
+# Create-mandate response keys, probed in order by extract_mandate_fields
+_MANDATE_ACTIVATION_KEYS = ("activation_url", "authorization_url", "redirect_url", "url")
+_MANDATE_TX_REF_KEYS = ("transaction_ref", "tx_ref", "transactionId")
+_MANDATE_REFERENCE_KEYS = ("reference", "mandate_reference")
+
+
+def first_truthy(src: dict, keys):
+    """Return the first truthy `keys` value in dict `src` (unconverted), or None."""
+    for key in keys:
+        value = src.get(key)
+        if value:
+            return value
+    return None
 
-    Tries, in order:
-      - response["data"]["activation_url"]
-      - response["activation_url"]
-      - response["data"]["url"]
-      - response["data"]["meta"]["activation_url"]
 
-    Returns the first non-empty string found or None.
-    """
+def _first_value(provider_response, paths) -> Optional[str]:
+    """Return str() of the first non-empty value found along `paths`, or None."""
     if not isinstance(provider_response, dict):
         return None
 
-    data = provider_response.get("data") if isinstance(provider_response, dict) else None
+    for path in paths:
+        cur = provider_response
+        for key in path:
+            if not isinstance(cur, dict):
+                cur = None
+                break
+            cur = cur.get(key)
+        if cur:
+            return str(cur)
 
-    # data.activation_url
-    if isinstance(data, dict):
-        v = data.get("activation_url")
-        if v:
-            return str(v)
+    return None
 
-    # top-level activation_url
-    v = provider_response.get("activation_url")
-    if v:
-        return str(v)
 
-    # data.url
-    if isinstance(data, dict):
-        v = data.get("url")
-        if v:
-            return str(v)
+def _first_key(provider_response, keys) -> Optional[str]:
+    """Return str() of the first non-empty `keys` value in `data`, then top level."""
+    if not isinstance(provider_response, dict):
+        return None
 
-    # data.meta.activation_url
-    if isinstance(data, dict):
-        meta = data.get("meta")
-        if isinstance(meta, dict):
-            v = meta.get("activation_url")
-            if v:
-                return str(v)
+    # provider_response is known to be a dict; only `data` needs checking
+    data = provider_response.get("data")
+    sources = (data, provider_response) if isinstance(data, dict) else (provider_response,)
+    for src in sources:
+        for key in keys:
+            value = src.get(key)
+            if value:
+                return str(value)
 
     return None
 
 
-def extract_provider_transaction_ref(provider_response: dict) -> Optional[str]:
-    """Extract a provider transaction reference from common shapes.
+def extract_activation_url(provider_response: dict) -> Optional[str]:
+    """Extract an activation/authorization URL from common provider response shapes.
 
-    Tries common keys under `data` and top-level: `transaction_ref`, `tx_ref`, `transactionId`.
-    """
-    if not isinstance(provider_response, dict):
-        return None
+    Tries, in order:
+      - response["data"]["activation_url"]
+      - response["activation_url"]
+      - response["data"]["url"]
+      - response["data"]["meta"]["activation_url"]
 
-    data = provider_response.get("data") if isinstance(provider_response, dict) else None
+    Returns the first non-empty string found or None.
+    """
+    return _first_value(provider_response, _ACTIVATION_URL_PATHS)
 
-    # data.transaction_ref
-    if isinstance(data, dict):
-        for key in ("transaction_ref", "tx_ref", "transactionId", "transaction_id"):
-            v = data.get(key)
-            if v:
-                return str(v)
 
-    # top-level transaction_ref
-    for key in ("transaction_ref", "tx_ref", "transactionId", "transaction_id"):
-        v = provider_response.get(key)
-        if v:
-            return str(v)
+def extract_provider_transaction_ref(provider_response: dict) -> Optional[str]:
+    """Extract a provider transaction reference from common shapes.
 
-    return None
+    Tries common keys under `data` and top-level: `transaction_ref`, `tx_ref`, `transactionId`.
+    """
+    return _first_key(provider_response, _TX_REF_KEYS)
 
 
 def extract_payment_id(provider_response: dict) -> Optional[str]:
     """Extract payment_id from provider response if present."""
-    if not isinstance(provider_response, dict):
-        return None
+    return _first_key(provider_response, _PAYMENT_ID_KEYS)
 
-    data = provider_response.get("data") if isinstance(provider_response, dict) else None
-    if isinstance(data, dict):
-        for key in ("payment_id", "paymentId", "payment_reference"):
-            v = data.get(key)
-            if v:
-                return str(v)
 
-    for key in ("payment_id", "paymentId", "payment_reference"):
-        v = provider_response.get(key)
-        if v:
-            return str(v)
+def extract_mandate_fields(response_data) -> dict:
+    """Extract the Mandate columns from a create-mandate response in one pass.
 
-    return None
+    `activation_url` and `transaction_ref` come from `data` (or the top level
+    when `data` is empty); `mandate_reference`, `subscription_id` and
+    `provider_status` come from `data.provider_response`. Missing values are
+    "" for the URL/ref and None for the rest.
+    """
+    fields = {
+        "activation_url": "",
+        "transaction_ref": "",
+        "mandate_reference": None,
+        "subscription_id": None,
+        "provider_status": None,
+    }
+    if not isinstance(response_data, dict):
+        return fields
+
+    inner = response_data.get("data")
+    data = inner or response_data
+    if isinstance(data, dict):
+        fields["activation_url"] = first_truthy(data, _MANDATE_ACTIVATION_KEYS) or ""
+        fields["transaction_ref"] = first_truthy(data, _MANDATE_TX_REF_KEYS) or ""
+
+    provider_resp = inner.get("provider_response") if isinstance(inner, dict) else None
+    if isinstance(provider_resp, dict):
+        fields["mandate_reference"] = first_truthy(provider_resp, _MANDATE_REFERENCE_KEYS)
+        fields["provider_status"] = provider_resp.get("status")
+        meta = provider_resp.get("meta")
+        if isinstance(meta, dict):
+            fields["subscription_id"] = meta.get("subscription_id")
+
+    return fields
@@ -3,17 +3,20 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.core.cache import cache
 from django.conf import settings
-from django.core.cache import cache
-from django.conf import settings
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Subquery
+from django.db.models.expressions import RawSQL
+from django.http import HttpResponse, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.cache import cache_control
 from django.utils import timezone
 
 from .serializers import (
     RegisterSerializer,
     LoginSerializer,
-    UserSerializer,
     ProfileMeSerializer,
     PersonalInfoSerializer,
     BankInfoSerializer,
@@ -26,53 +29,144 @@ from .serializers import (
 )
 from .models import Profile, ProfileVerificationAttempt, WebhookEvent, RulesEngine, Mandate
 from .onepipe_client import OnePipeClient, OnePipeError, build_create_mandate_payload, build_cancel_mandate_payload
-import uuid
 import json
-from .utils.onepipe_utils import extract_activation_url, extract_provider_transaction_ref, extract_payment_id
+import logging
+import time
+import threading
+from secrets import token_hex
+from .utils.onepipe_utils import (
+    extract_activation_url,
+    extract_mandate_fields,
+    extract_payment_id,
+    extract_provider_transaction_ref,
+    first_truthy,
+)
+from .utils.inflight import coalesce
+from .parsers import loads as json_loads
 
+logger = logging.getLogger(__name__)
 
-class HomeView(APIView):
-    """Welcome/homepage endpoint with API info"""
-    permission_classes = (AllowAny,)
 
-    def get(self, request):
-        return Response({
-            "message": "Welcome to Kore OnePipe API",
-            "version": "1.0.0",
-            "description": "Bank account verification platform using OnePipe PayWithAccount",
-            "docs": {
-                "urls": "/docs/URLS_README.md",
-                "banks_endpoint": "/docs/BANKS_ENDPOINT.md",
+def _get_or_create_profile(user):
+    """Return the user's profile, creating it only when missing.
+
+    Reads the reverse one-to-one first (free when already cached on the user),
+    so the common path is at most one SELECT with no get_or_create round-trip.
+    """
+    try:
+        return user.profile
+    except Profile.DoesNotExist:
+        profile, created = Profile.objects.get_or_create(
+            user=user,
+            defaults={"first_name": user.first_name, "is_completed": False},
+        )
+        return profile
+
+
+def _save_draft_section(user, section, data):
+    """Store `data` under draft_payload[section] for the user's profile.
+
+    On PostgreSQL this is a single atomic jsonb_set UPDATE: no SELECT first,
+    only the changed subtree is sent, and concurrent PATCHes to the other
+    section are not lost. A draft that is not a JSON object (e.g. a JSON
+    null scalar, which COALESCE would keep) is started over as {}. Other
+    backends (SQLite in tests) fall back to a read-modify-write limited to
+    draft_payload.
+    """
+    if connection.vendor == "postgresql":
+        updated = Profile.objects.filter(user_id=user.pk).update(
+            draft_payload=RawSQL(
+                "jsonb_set(CASE jsonb_typeof(draft_payload) WHEN 'object' THEN draft_payload"
+                " ELSE '{}'::jsonb END, %s::text[], %s::jsonb)",
+                ("{%s}" % section, json.dumps(data)),
+            ),
+            updated_at=timezone.now(),
+        )
+        if updated:
+            return
+
+    profile = _get_or_create_profile(user)
+    if not isinstance(profile.draft_payload, dict):
+        profile.draft_payload = {}
+    profile.draft_payload[section] = data
+    profile.save(update_fields=["draft_payload", "updated_at"])
+
+
+def _user_payload(user):
+    """Same shape as UserSerializer(user).data, built directly from the instance"""
+    return {"id": user.id, "name": user.first_name, "email": user.email}
+
+
+def issue_tokens(user):
+    """Mint a refresh/access JWT pair for `user`, encoding each token once.
+
+    simplejwt signs through its module-level TokenBackend, which already holds
+    the signing key; with the default HS256 there is no PEM to parse.
+    """
+    refresh = RefreshToken.for_user(user)
+    return {
+        "access": str(refresh.access_token),
+        "refresh": str(refresh),
+    }
+
+
+# Static JSON endpoints may be cached by browsers and shared proxies
+_static_json_cache = method_decorator(cache_control(public=True, max_age=3600), name="get")
+
+
+@_static_json_cache
+class HomeView(View):
+    """Welcome/homepage endpoint with API info
+
+    A plain Django view: the response is public and static, so DRF's request
+    wrapping, authentication and content negotiation are skipped entirely.
+    """
+
+    # Static API info; encoded once at import and served as-is
+    INFO = {
+        "message": "Welcome to Kore OnePipe API",
+        "version": "1.0.0",
+        "description": "Bank account verification platform using OnePipe PayWithAccount",
+        "docs": {
+            "urls": "/docs/URLS_README.md",
+            "banks_endpoint": "/docs/BANKS_ENDPOINT.md",
+        },
+        "endpoints": {
+            "auth": {
+                "signup": "POST /api/auth/signup/",
+                "login": "POST /api/auth/login/",
+                "me": "GET /api/auth/me/",
             },
-            "endpoints": {
-                "auth": {
-                    "signup": "POST /api/auth/signup/",
-                    "login": "POST /api/auth/login/",
-                    "me": "GET /api/auth/me/",
-                },
-                "profile": {
-                    "view": "GET /api/profile/me/",
-                    "update_personal": "PATCH /api/profile/personal/",
-                    "update_bank": "PATCH /api/profile/bank/",
-                    "submit": "POST /api/profile/submit/",
-                },
-                "rules": {
-                    "create": "POST /api/rules-engine/",
-                },
-                "banks": "GET /api/banks/",
-                "webhook": "POST /api/webhooks/onepipe/",
-            }
-        }, status=status.HTTP_200_OK)
+            "profile": {
+                "view": "GET /api/profile/me/",
+                "update_personal": "PATCH /api/profile/personal/",
+                "update_bank": "PATCH /api/profile/bank/",
+                "submit": "POST /api/profile/submit/",
+            },
+            "rules": {
+                "create": "POST /api/rules-engine/",
+            },
+            "banks": "GET /api/banks/",
+            "webhook": "POST /api/webhooks/onepipe/",
+        }
+    }
 
+    BODY = json.dumps(INFO).encode("utf-8")
 
-class ServicesView(APIView):
+    def get(self, request):
+        # Invariant payload: skip content negotiation and rendering
+        return HttpResponse(self.BODY, content_type="application/json", status=status.HTTP_200_OK)
+
+
+@_static_json_cache
+class ServicesView(View):
     """
     List of supported financial services.
     
     Used by the frontend for rules engine and service selection during mandate setup.
-    Returns a static, ordered list of services with keys and human-readable labels.
+    Returns a static, ordered list of services with keys and human-readable labels,
+    pre-encoded once like HomeView.
     """
-    permission_classes = (AllowAny,)
 
     # Static list of supported financial services
     SERVICES = [
@@ -83,12 +177,11 @@ class ServicesView(APIView):
         {"key": "BILLS", "label": "Bills"},
     ]
 
+    BODY = json.dumps({"services": SERVICES}).encode("utf-8")
+
     def get(self, request):
         """GET /api/services/ - Return list of supported financial services"""
-        return Response(
-            {"services": self.SERVICES},
-            status=status.HTTP_200_OK,
-        )
+        return HttpResponse(self.BODY, content_type="application/json", status=status.HTTP_200_OK)
 
 
 class SignupView(APIView):
@@ -98,22 +191,15 @@ class SignupView(APIView):
     def post(self, request):
         serializer = RegisterSerializer(data=request.data)
         if serializer.is_valid():
-            user = serializer.save()
-            # Profile is auto-created by signal when user is created
-            # No need to create it manually here
-            
-            # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
+            # User and its signal-created Profile commit together
+            with transaction.atomic():
+                user = serializer.save()
             
             # Return user data and tokens
-            user_serializer = UserSerializer(user)
             return Response(
                 {
-                    "user": user_serializer.data,
-                    "tokens": {
-                        "access": str(refresh.access_token),
-                        "refresh": str(refresh),
-                    },
+                    "user": _user_payload(user),
+                    "tokens": issue_tokens(user),
                 },
                 status=status.HTTP_201_CREATED,
             )
@@ -126,17 +212,18 @@ class MeView(APIView):
 
     def get(self, request):
         user = request.user
-        profile = None
-        try:
-            profile = user.profile
-        except Exception:
-            profile = None
+        # Only is_completed is needed; skip loading the rest of the profile row
+        is_completed = (
+            Profile.objects.filter(user_id=user.pk)
+            .values_list("is_completed", flat=True)
+            .first()
+        )
 
         data = {
             "id": user.id,
             "name": user.first_name,
             "email": user.email,
-            "profile": {"is_completed": profile.is_completed if profile else False},
+            "profile": {"is_completed": bool(is_completed)},
         }
         return Response(data, status=status.HTTP_200_OK)
 
@@ -150,18 +237,11 @@ class LoginView(APIView):
         if serializer.is_valid():
             user = serializer.validated_data["user"]
             
-            # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
-            
             # Return user data and tokens
-            user_serializer = UserSerializer(user)
             return Response(
                 {
-                    "user": user_serializer.data,
-                    "tokens": {
-                        "access": str(refresh.access_token),
-                        "refresh": str(refresh),
-                    },
+                    "user": _user_payload(user),
+                    "tokens": issue_tokens(user),
                 },
                 status=status.HTTP_200_OK,
             )
@@ -172,48 +252,56 @@ class ProfileMeView(APIView):
     """Return current user's full profile with email"""
     permission_classes = (IsAuthenticated,)
 
+    # Columns ProfileMeSerializer reads; the encrypted fields and the draft
+    # JSON are never loaded for this response
+    PROFILE_FIELDS = (
+        "first_name", "surname", "phone_number", "date_of_birth", "gender",
+        "bank_name", "bank_code", "is_completed",
+    )
+
     def get(self, request):
         user = request.user
-        # Get or create profile if missing
-        profile, created = Profile.objects.get_or_create(
-            user=user,
-            defaults={"first_name": user.first_name, "is_completed": False},
-        )
+        profile = Profile.objects.only(*self.PROFILE_FIELDS).filter(user_id=user.pk).first()
+        if profile is None:
+            profile = _get_or_create_profile(user)
 
         serializer = ProfileMeSerializer(profile, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+# Personal draft keys, in response order
+_PERSONAL_DRAFT_FIELDS = ("first_name", "surname", "phone_number", "date_of_birth", "gender")
+
+
 class PersonalInfoUpdateView(APIView):
     """Update personal information on profile (stores in draft_payload)"""
     permission_classes = (IsAuthenticated,)
 
     def patch(self, request):
         user = request.user
-        # Get or create profile if missing
-        profile, created = Profile.objects.get_or_create(
-            user=user,
-            defaults={"first_name": user.first_name, "is_completed": False},
-        )
-
         serializer = PersonalInfoSerializer(data=request.data)
         if serializer.is_valid():
+            data = serializer.validated_data
+            date_of_birth = data.get("date_of_birth")
+
             # Store unverified personal data in draft_payload
             draft_personal = {
-                "first_name": serializer.validated_data.get("first_name", ""),
-                "surname": serializer.validated_data.get("surname", ""),
-                "phone_number": serializer.validated_data.get("phone_number", ""),
-                "date_of_birth": str(serializer.validated_data.get("date_of_birth")) if serializer.validated_data.get("date_of_birth") else None,
-                "gender": serializer.validated_data.get("gender"),
+                "first_name": data.get("first_name", ""),
+                "surname": data.get("surname", ""),
+                "phone_number": data.get("phone_number", ""),
+                "date_of_birth": str(date_of_birth) if date_of_birth else None,
+                "gender": data.get("gender"),
             }
             
-            if not profile.draft_payload:
-                profile.draft_payload = {}
-            profile.draft_payload["personal"] = draft_personal
-            profile.save()
+            # Get or create profile if missing, then store the draft section
+            _save_draft_section(user, "personal", draft_personal)
 
             # Return saved draft data (exclude None/empty values)
-            response_data = {k: v for k, v in draft_personal.items() if v}
+            response_data = {}
+            for key in _PERSONAL_DRAFT_FIELDS:
+                value = draft_personal[key]
+                if value:
+                    response_data[key] = value
             return Response(response_data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -223,52 +311,58 @@ class BankInfoUpdateView(APIView):
     permission_classes = (IsAuthenticated,)
 
     def patch(self, request):
-        from .encryption import encrypt_value
+        from .encryption import encrypt_values
         
         user = request.user
-        # Get or create profile if missing
-        profile, created = Profile.objects.get_or_create(
-            user=user,
-            defaults={"first_name": user.first_name, "is_completed": False},
-        )
-
         serializer = BankInfoSerializer(data=request.data)
         if serializer.is_valid():
             # Encrypt sensitive fields
-            account_number = serializer.validated_data.get("account_number")
-            bvn = serializer.validated_data.get("bvn")
-            account_number_encrypted = encrypt_value(account_number) if account_number else ""
-            bvn_encrypted = encrypt_value(bvn) if bvn else ""
+            data = serializer.validated_data
+            account_number_encrypted, bvn_encrypted = encrypt_values([data.get("account_number"), data.get("bvn")])
+            bank_name = data.get("bank_name", "")
+            bank_code = data.get("bank_code", "")
             
             # Store encrypted bank data in draft_payload
             draft_bank = {
-                "bank_name": serializer.validated_data.get("bank_name", ""),
-                "bank_code": serializer.validated_data.get("bank_code", ""),
+                "bank_name": bank_name,
+                "bank_code": bank_code,
                 "account_number_encrypted": account_number_encrypted,
                 "bvn_encrypted": bvn_encrypted,
             }
             
-            if not profile.draft_payload:
-                profile.draft_payload = {}
-            profile.draft_payload["bank"] = draft_bank
-            profile.save()
+            # Get or create profile if missing, then store the draft section
+            _save_draft_section(user, "bank", draft_bank)
 
             # Return safe response without plaintext
             return Response(
-                {
-                    "bank_name": draft_bank["bank_name"],
-                    "bank_code": draft_bank["bank_code"],
-                },
+                {"bank_name": bank_name, "bank_code": bank_code},
                 status=status.HTTP_200_OK,
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class BanksView(APIView):
-    """Fetch list of banks from OnePipe with caching"""
-    permission_classes = (AllowAny,)
-    CACHE_KEY = "onepipe:get_banks"
+# Per-process banks cache; the list is read-mostly so a plain dict lookup
+# avoids the pickle round-trip of django.core.cache on every hit. It holds
+# the already-encoded JSON body so hits skip rendering entirely.
+_BANKS_CACHE = {"body": None, "ts": 0}
+# Held while a background refresh of an expired banks list is running
+_BANKS_REFRESH_LOCK = threading.Lock()
+
+# Provider key aliases for a bank row, probed in priority order
+_BANK_NAME_KEYS = ("bank_name", "name", "bank", "bankFullName")
+_BANK_CODE_KEYS = ("bank_code", "code", "bankCode")
+
+
+@method_decorator(cache_control(public=True, max_age=300), name="get")
+class BanksView(View):
+    """Fetch list of banks from OnePipe with caching
+
+    A plain Django view like HomeView: the list is public and served as
+    pre-encoded bytes, so DRF's request pipeline adds nothing. Browsers and
+    proxies may reuse a response for a few minutes.
+    """
     CACHE_TIMEOUT = 3600  # 1 hour
+    RETRY_AFTER = 60  # seconds before retrying after a failed refresh
     
     # Fallback list of major Nigerian banks for when provider fails
     FALLBACK_BANKS = [
@@ -286,10 +380,45 @@ class BanksView(APIView):
 
     def get(self, request):
         # Check cache first
-        cached_banks = cache.get(self.CACHE_KEY)
-        if cached_banks is not None:
-            return Response(cached_banks, status=status.HTTP_200_OK)
-
+        cached_body = self._get_cached_banks()
+        if cached_body is not None:
+            return self._banks_response(cached_body)
+
+        # Expired: serve the stale list and refresh it off the request thread
+        stale_body = _BANKS_CACHE["body"]
+        if stale_body is not None:
+            self._refresh_in_background()
+            return self._banks_response(stale_body)
+
+        # Cold start, single-flight refresh: on expiry, concurrent requests share one
+        # OnePipe call instead of each hitting the provider
+        return self._banks_response(coalesce("onepipe:get_banks", self._fetch_banks))
+
+    @staticmethod
+    def _banks_response(body):
+        """Serve pre-encoded banks JSON without DRF negotiation or rendering"""
+        return HttpResponse(body, content_type="application/json", status=status.HTTP_200_OK)
+
+    def _fetch_banks(self):
+        """Fetch banks from OnePipe; caches and returns the encoded body.
+
+        If the provider fails, a previously cached list is kept and retried
+        after RETRY_AFTER seconds. With nothing cached yet, FALLBACK_BANKS is
+        cached for the usual CACHE_TIMEOUT instead.
+        """
+        banks = self._fetch_provider_banks()
+        if banks is None:
+            stale_body = _BANKS_CACHE["body"]
+            if stale_body is not None:
+                # Keep the last good list; it expires again RETRY_AFTER from now
+                _BANKS_CACHE["ts"] = time.time() - self.CACHE_TIMEOUT + self.RETRY_AFTER
+                return stale_body
+            banks = self.FALLBACK_BANKS
+
+        return self._set_cached_banks(banks)
+
+    def _fetch_provider_banks(self):
+        """Return the provider's banks list, or None when the provider failed."""
         try:
             client = OnePipeClient()
             # Use builder from onepipe_client for consistent payloads
@@ -299,27 +428,46 @@ class BanksView(APIView):
             result = client.transact(payload)
             response_data = result.get("response", {})
 
-            # Parse banks defensively
-            banks = self._parse_banks_from_response_v2(response_data)
+            # Parse banks defensively; None means the provider failed
+            return self._parse_banks_from_response_v2(response_data)
 
-            if banks is None:
-                # Provider failed, use fallback
-                cache.set(self.CACHE_KEY, self.FALLBACK_BANKS, self.CACHE_TIMEOUT)
-                return Response(self.FALLBACK_BANKS, status=status.HTTP_200_OK)
+        except OnePipeError:
+            return None
 
-            # Cache and return
-            cache.set(self.CACHE_KEY, banks, self.CACHE_TIMEOUT)
-            return Response(banks, status=status.HTTP_200_OK)
+        except Exception:
+            # Unexpected errors are treated like a provider failure
+            return None
 
-        except OnePipeError as e:
-            # On provider error, use fallback
-            cache.set(self.CACHE_KEY, self.FALLBACK_BANKS, self.CACHE_TIMEOUT)
-            return Response(self.FALLBACK_BANKS, status=status.HTTP_200_OK)
+    def _refresh_in_background(self):
+        """Start one daemon thread to refetch banks unless a refresh is already running.
 
-        except Exception as e:
-            # On unexpected error, use fallback
-            cache.set(self.CACHE_KEY, self.FALLBACK_BANKS, self.CACHE_TIMEOUT)
-            return Response(self.FALLBACK_BANKS, status=status.HTTP_200_OK)
+        A thread rather than a scheduled task: _BANKS_CACHE lives in this
+        process's memory, so a management command or worker process could
+        not warm it, and the project runs no task queue. Once the list has
+        loaded, requests only ever wait on memory.
+        """
+        if not _BANKS_REFRESH_LOCK.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                self._fetch_banks()
+            finally:
+                _BANKS_REFRESH_LOCK.release()
+
+        threading.Thread(target=refresh, name="banks-refresh", daemon=True).start()
+
+    def _get_cached_banks(self):
+        """Return the cached banks JSON body, or None if missing or expired."""
+        if _BANKS_CACHE["body"] is not None and time.time() - _BANKS_CACHE["ts"] < self.CACHE_TIMEOUT:
+            return _BANKS_CACHE["body"]
+        return None
+
+    def _set_cached_banks(self, banks):
+        """Encode `banks` once and cache the body; returns the body."""
+        body = json.dumps(banks, separators=(",", ":")).encode("utf-8")
+        _BANKS_CACHE.update(body=body, ts=time.time())
+        return body
 
     def _parse_banks_from_response(self, response_data):
         """
@@ -384,15 +532,12 @@ class BanksView(APIView):
             if not banks_list:
                 return None
 
-            normalized = []
-            for item in banks_list:
-                if not isinstance(item, dict):
-                    continue
-                name = item.get("bank_name") or item.get("name") or item.get("bank") or item.get("bankFullName")
-                code = item.get("bank_code") or item.get("code") or item.get("bankCode")
-                if not code:
-                    continue
-                normalized.append({"name": name or "Unknown", "code": code})
+            # Resolve the code first so rows without one skip the name probes
+            normalized = [
+                {"name": first_truthy(item, _BANK_NAME_KEYS) or "Unknown", "code": code}
+                for item in banks_list
+                if isinstance(item, dict) and (code := first_truthy(item, _BANK_CODE_KEYS))
+            ]
 
             return normalized if normalized else None
         except Exception:
@@ -405,49 +550,57 @@ class ProfileSubmitView(APIView):
 
     def post(self, request):
         user = request.user
-        try:
-            profile = user.profile
-        except Profile.DoesNotExist:
-            return Response(
-                {"error": "Profile does not exist"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Validate draft_payload has both personal and bank data
-        draft_personal = profile.draft_payload.get("personal")
-        draft_bank = profile.draft_payload.get("bank")
-
-        if not draft_personal or not draft_bank:
-            return Response(
-                {"error": "Both personal and bank information are required. Please complete both sections."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
         # Build OnePipe payload for bank account lookup using builder function
         from .onepipe_client import build_lookup_accounts_min_payload
-        
+
         client = OnePipeClient()
-        
-        # Get account number from draft (stored as plaintext in test draft_payload,
-        # but normally would be encrypted. For OnePipe lookup, we need plaintext.)
-        # In production, if account is encrypted in draft, it should be decrypted before passing to builder
-        account_number = draft_bank.get("account_number", "")  # Plaintext key in draft
-        
-        # Build payload using proper builder with Triple DES encryption
-        payload = build_lookup_accounts_min_payload(
-            customer_ref=f"user-{user.id}",
-            account_number=account_number,
-            bank_code=draft_bank.get("bank_code", ""),
-            bvn=draft_bank.get("bvn"),  # Plaintext BVN from draft
-            first_name=draft_personal.get("first_name", ""),
-            last_name=draft_personal.get("surname", ""),
-            mobile_no=draft_personal.get("phone_number", ""),
-            transaction_desc="Bank account verification for profile completion",
-        )
+        payload = None
 
         try:
             # Call OnePipe with atomic transaction
             with transaction.atomic():
+                # Serialize submits per user: the draft is read under the row
+                # lock, so a concurrent submit waits here and, once the first
+                # one has consumed the draft, stops instead of calling OnePipe
+                # and logging a second attempt
+                profile = (
+                    Profile.objects.select_for_update(of=("self",))
+                    .filter(user=user)
+                    .first()
+                )
+                if profile is None:
+                    return Response(
+                        {"error": "Profile does not exist"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                # Validate draft_payload has both personal and bank data
+                draft_personal = profile.draft_payload.get("personal")
+                draft_bank = profile.draft_payload.get("bank")
+
+                if not draft_personal or not draft_bank:
+                    return Response(
+                        {"error": "Both personal and bank information are required. Please complete both sections."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                # Get account number from draft (stored as plaintext in test draft_payload,
+                # but normally would be encrypted. For OnePipe lookup, we need plaintext.)
+                # In production, if account is encrypted in draft, it should be decrypted before passing to builder
+                account_number = draft_bank.get("account_number", "")  # Plaintext key in draft
+
+                # Build payload using proper builder with Triple DES encryption
+                payload = build_lookup_accounts_min_payload(
+                    customer_ref=f"user-{user.id}",
+                    account_number=account_number,
+                    bank_code=draft_bank.get("bank_code", ""),
+                    bvn=draft_bank.get("bvn"),  # Plaintext BVN from draft
+                    first_name=draft_personal.get("first_name", ""),
+                    last_name=draft_personal.get("surname", ""),
+                    mobile_no=draft_personal.get("phone_number", ""),
+                    transaction_desc="Bank account verification for profile completion",
+                )
+
                 # Call OnePipeClient
                 result = client.transact(payload)
                 request_ref = result.get("request_ref", "")
@@ -456,15 +609,6 @@ class ProfileSubmitView(APIView):
                 # Check if lookup was successful
                 is_verified = self._check_verification_success(response_data)
 
-                # Redact plaintext from payload for auditing
-                redacted_payload = {
-                    **payload,
-                    "transaction": {
-                        **payload["transaction"],
-                        "account_number": "[ENCRYPTED]",
-                    }
-                }
-
                 if is_verified:
                     # Copy draft data to final fields
                     profile.first_name = draft_personal.get("first_name", "")
@@ -482,73 +626,61 @@ class ProfileSubmitView(APIView):
                     # Mark as completed and clear draft
                     profile.is_completed = True
                     profile.draft_payload = {}
-                    profile.save()
-
-                    # Log successful attempt
-                    ProfileVerificationAttempt.objects.create(
-                        user=user,
-                        request_ref=request_ref,
-                        request_type="lookup accounts min",
-                        payload_sent=redacted_payload,
-                        response=response_data,
-                        status="success",
-                    )
+                    # Single UPDATE limited to the columns copied from the draft
+                    profile.save(update_fields=[
+                        "first_name", "surname", "phone_number", "date_of_birth", "gender",
+                        "bank_name", "bank_code", "account_number_encrypted", "bvn_encrypted",
+                        "is_completed", "draft_payload", "updated_at",
+                    ])
+
+            # The audit row is written after the profile lock is released so
+            # the INSERT does not extend the locked transaction. The outcome is
+            # already committed by then, so a failed audit write is logged
+            # rather than turned into a 500 and a second, "error" attempt
+            try:
+                self._log_attempt(
+                    user,
+                    request_ref,
+                    payload,
+                    response_data,
+                    "success" if is_verified else "failed",
+                )
+            except Exception:
+                logger.exception("Could not record profile verification attempt for user %s", user.pk)
 
-                    # Return success with profile summary
-                    return Response(
-                        {
-                            "status": "verified",
-                            "message": "Your bank account has been verified successfully",
-                            "profile": {
-                                "is_completed": True,
-                                "bank_name": profile.bank_name,
-                                "bank_code": profile.bank_code,
-                            },
+            if is_verified:
+                # Return success with profile summary
+                return Response(
+                    {
+                        "status": "verified",
+                        "message": "Your bank account has been verified successfully",
+                        "profile": {
+                            "is_completed": True,
+                            "bank_name": profile.bank_name,
+                            "bank_code": profile.bank_code,
                         },
-                        status=status.HTTP_200_OK,
-                    )
-                else:
-                    # Lookup failed - do not copy draft data
-                    log_status = "failed"
-                    
-                    # Log failed attempt
-                    ProfileVerificationAttempt.objects.create(
-                        user=user,
-                        request_ref=request_ref,
-                        request_type="lookup accounts min",
-                        payload_sent=redacted_payload,
-                        response=response_data,
-                        status=log_status,
-                    )
+                    },
+                    status=status.HTTP_200_OK,
+                )
 
-                    # Return failure response
-                    return Response(
-                        {
-                            "error": "Bank verification failed",
-                            "message": self._extract_error_message(response_data),
-                            "provider_response": response_data,
-                        },
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
+            # Lookup failed - draft data was not copied
+            return Response(
+                {
+                    "error": "Bank verification failed",
+                    "message": self._extract_error_message(response_data),
+                    "provider_response": response_data,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         except OnePipeError as e:
             # OnePipe API error
-            request_ref = getattr(e, "request_ref", "unknown")
-            redacted_payload = {
-                **payload,
-                "transaction": {
-                    **payload["transaction"],
-                    "account_number": "[ENCRYPTED]",
-                }
-            }
-            
-            ProfileVerificationAttempt.objects.create(
-                user=user,
-                request_ref=request_ref,
-                request_type="lookup accounts min",
-                payload_sent=redacted_payload,
-                response={"error": str(e), "status_code": getattr(e, "status_code", None)},
-                status="error",
+            self._log_attempt(
+                user,
+                getattr(e, "request_ref", "unknown"),
+                payload,
+                {"error": str(e), "status_code": getattr(e, "status_code", None)},
+                "error",
             )
 
             return Response(
@@ -560,22 +692,7 @@ class ProfileSubmitView(APIView):
             )
         except Exception as e:
             # Unexpected error
-            redacted_payload = {
-                **payload,
-                "transaction": {
-                    **payload["transaction"],
-                    "account_number": "[ENCRYPTED]",
-                }
-            }
-            
-            ProfileVerificationAttempt.objects.create(
-                user=user,
-                request_ref="unknown",
-                request_type="lookup accounts min",
-                payload_sent=redacted_payload,
-                response={"error": str(e)},
-                status="error",
-            )
+            self._log_attempt(user, "unknown", payload, {"error": str(e)}, "error")
 
             return Response(
                 {
@@ -585,6 +702,29 @@ class ProfileSubmitView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def _log_attempt(self, user, request_ref, payload, response_data, log_status):
+        """Record a lookup attempt with the plaintext account number redacted"""
+        ProfileVerificationAttempt.objects.create(
+            user=user,
+            request_ref=request_ref,
+            request_type="lookup accounts min",
+            # No payload when the request failed before it was built
+            payload_sent=self._redact_payload(payload) if payload else {},
+            response=response_data,
+            status=log_status,
+        )
+
+    @staticmethod
+    def _redact_payload(payload):
+        """Copy of the lookup payload with the plaintext account number masked for auditing"""
+        return {
+            **payload,
+            "transaction": {
+                **payload["transaction"],
+                "account_number": "[ENCRYPTED]",
+            }
+        }
+
     def _check_verification_success(self, response_data):
         """Check if OnePipe response indicates successful verification"""
         # Success indicators: status="Successful" or response status code indicates success
@@ -617,9 +757,15 @@ class ProfileSubmitView(APIView):
         return "Verification failed. Please check your details and try again."
 
 
-class OnePipeWebhookView(APIView):
-    """Handle OnePipe webhook events"""
-    permission_classes = (AllowAny,)
+@method_decorator(csrf_exempt, name="dispatch")
+class OnePipeWebhookView(View):
+    """Handle OnePipe webhook events
+
+    A plain Django view: the provider is unauthenticated and only the raw JSON
+    is stored, so the body is decoded once here without DRF's request
+    wrapping, parser negotiation or renderer.
+    """
+    http_method_names = ["post"]
 
     def post(self, request):
         """
@@ -627,42 +773,37 @@ class OnePipeWebhookView(APIView):
         Non-blocking, returns 200 OK immediately.
         """
         try:
-            payload = request.data or {}
+            payload = json_loads(request.body) if request.body else {}
+            if not isinstance(payload, dict):
+                raise ValueError("Webhook body must be a JSON object")
             request_ref = payload.get("request_ref")
             
-            # Try to find associated verification attempt
-            verification_attempt = None
+            # Correlate with the verification attempt inside the INSERT itself
+            # (a scalar subquery on its pk), so storing the webhook is one
+            # round-trip. Not found is okay - the FK is just left NULL
+            verification_attempt_id = None
             if request_ref:
-                try:
-                    verification_attempt = ProfileVerificationAttempt.objects.get(
-                        request_ref=request_ref
-                    )
-                except ProfileVerificationAttempt.DoesNotExist:
-                    # Not found, but that's okay - we still store the webhook
-                    pass
+                verification_attempt_id = Subquery(
+                    ProfileVerificationAttempt.objects.filter(request_ref=request_ref)
+                    .values("pk")[:1]
+                )
             
             # Store webhook event
             webhook_event = WebhookEvent.objects.create(
                 provider="onepipe",
                 payload=payload,
-                verification_attempt=verification_attempt,
+                verification_attempt_id=verification_attempt_id,
                 processed=False,
             )
             
-            return Response(
-                {
-                    "status": "received",
-                    "webhook_id": webhook_event.id,
-                },
-                status=status.HTTP_200_OK,
-            )
+            return JsonResponse({"status": "received", "webhook_id": webhook_event.id})
         
         except Exception as e:
             # Log error but still return 200 OK (don't want OnePipe retrying)
             try:
                 WebhookEvent.objects.create(
                     provider="onepipe",
-                    payload=request.data or {},
+                    payload={"raw": request.body.decode("utf-8", "replace")},
                     processed=False,
                     error=str(e),
                 )
@@ -670,19 +811,29 @@ class OnePipeWebhookView(APIView):
                 # Even if logging fails, return 200 OK
                 pass
             
-            return Response(
-                {
-                    "status": "received",
-                    "warning": "Webhook stored but error during processing",
-                },
-                status=status.HTTP_200_OK,
-            )
+            return JsonResponse({
+                "status": "received",
+                "warning": "Webhook stored but error during processing",
+            })
 
 
 # Provide a module-level callable name expected by routing
 banks_list = BanksView.as_view()
 
 
+def _active_rule(request):
+    """Active RulesEngine for request.user, or None; looked up once per request.
+
+    The memo lives on the request object only, so every request (in any worker
+    process) still reads the current row.
+    """
+    try:
+        return request._active_rule
+    except AttributeError:
+        request._active_rule = RulesEngine.get_active_for_user(request.user)
+        return request._active_rule
+
+
 class RulesEngineCreateView(APIView):
     """
     Create and manage debit rules for the authenticated user.
@@ -725,7 +876,7 @@ class RulesEngineCreateView(APIView):
             "error": "No rules engine configured yet."
         }
         """
-        rule = RulesEngine.get_active_for_user(request.user)
+        rule = _active_rule(request)
         if not rule:
             return Response({"error": "No rules engine configured yet."}, status=status.HTTP_404_NOT_FOUND)
         serializer = RulesEngineSerializer(rule)
@@ -811,7 +962,7 @@ class RulesEngineDetailView(APIView):
             "error": "No rules engine configured yet."
         }
         """
-        rule = RulesEngine.get_active_for_user(request.user)
+        rule = _active_rule(request)
         if not rule:
             return Response({"error": "No rules engine configured yet."}, status=status.HTTP_404_NOT_FOUND)
         serializer = RulesEngineSerializer(rule)
@@ -825,7 +976,7 @@ class RulesEngineDetailView(APIView):
         - Applies partial updates via RulesEngineUpdateSerializer
         - Returns updated RulesEngine data
         """
-        rule = RulesEngine.get_active_for_user(request.user)
+        rule = _active_rule(request)
         if not rule:
             return Response({"error": "No rules engine configured yet."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -846,7 +997,7 @@ class RulesEngineDisableView(APIView):
 
     def post(self, request):
         """POST /api/rules-engine/me/disable/ - mark active rule as inactive"""
-        rule = RulesEngine.get_active_for_user(request.user)
+        rule = _active_rule(request)
         if not rule:
             return Response({"error": "No rules engine configured yet."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -861,6 +1012,10 @@ class RulesEngineDisableView(APIView):
         )
 
 
+# Lower-cased top-level provider statuses treated as success
+_PROVIDER_SUCCESS_STATUSES = frozenset({"successful", "success", "ok"})
+
+
 class MandateCreateView(APIView):
     """POST /api/mandates/create/ - create a mandate via OnePipe
 
@@ -891,62 +1046,34 @@ class MandateCreateView(APIView):
             request_ref = result.get("request_ref")
             response_data = result.get("response")
 
-            # Persist Mandate and extract provider identifiers
-            provider_resp = {}
-            try:
-                if isinstance(response_data, dict):
-                    provider_resp = response_data.get("data", {}).get("provider_response") or {}
-            except Exception:
-                provider_resp = {}
+            # Extract provider identifiers
+            fields = extract_mandate_fields(response_data)
+            provider_status = fields["provider_status"]
 
-            activation_url = ""
-            transaction_ref = ""
-            if isinstance(response_data, dict):
-                data = response_data.get("data") or response_data
-                if isinstance(data, dict):
-                    activation_url = data.get("activation_url") or data.get("authorization_url") or data.get("redirect_url") or data.get("url") or ""
-                    transaction_ref = data.get("transaction_ref") or data.get("tx_ref") or data.get("transactionId") or ""
-
-            # Extract fields from provider_response
-            mandate_reference = None
-            subscription_id = None
-            provider_status = None
-            if isinstance(provider_resp, dict):
-                mandate_reference = provider_resp.get("reference") or provider_resp.get("mandate_reference")
-                provider_status = provider_resp.get("status")
-                meta = provider_resp.get("meta") or {}
-                try:
-                    subscription_id = meta.get("subscription_id")
-                except Exception:
-                    subscription_id = None
-
-            # Decide status
-            save_status = "PENDING"
-            if provider_status == "ACTIVE":
-                save_status = "ACTIVE"
-            elif provider_status and provider_status.upper() in ("SUCCESSFUL", "SUCCESS", "OK"):
-                save_status = "PENDING"
+            # Decide status: only an explicit ACTIVE activates; anything else
+            # (including a successful-but-unactivated reply) stays PENDING
+            save_status = "ACTIVE" if provider_status == "ACTIVE" else "PENDING"
 
-            with transaction.atomic():
-                mandate = Mandate.objects.create(
-                    user=user,
-                    rules_engine=rules_engine,
-                    status=save_status,
-                    request_ref=request_ref or uuid.uuid4().hex,
-                    transaction_ref=transaction_ref or "",
-                    activation_url=activation_url or "",
-                    payment_id=extract_payment_id(response_data) or "",
-                    mandate_reference=mandate_reference or "",
-                    subscription_id=subscription_id,
-                    provider_response=response_data,
-                )
+            # A single-row INSERT is atomic on its own under autocommit
+            mandate = Mandate.objects.create(
+                user=user,
+                rules_engine=rules_engine,
+                status=save_status,
+                request_ref=request_ref or token_hex(16),
+                transaction_ref=fields["transaction_ref"],
+                activation_url=fields["activation_url"],
+                payment_id=extract_payment_id(response_data) or "",
+                mandate_reference=fields["mandate_reference"] or "",
+                subscription_id=fields["subscription_id"],
+                provider_response=response_data,
+            )
 
             # If provider indicated failure via top-level status, return 400
             top_status = ""
             if isinstance(response_data, dict):
                 top_status = str(response_data.get("status", "")).lower()
 
-            if top_status and top_status not in ("successful", "success", "ok"):
+            if top_status and top_status not in _PROVIDER_SUCCESS_STATUSES:
                 return Response(
                     {
                         "message": "Provider indicated failure",
@@ -967,14 +1094,13 @@ class MandateCreateView(APIView):
 
         except OnePipeError as e:
             # Persist failed mandate record
-            with transaction.atomic():
-                mandate = Mandate.objects.create(
-                    user=user,
-                    rules_engine=rules_engine,
-                    status="FAILED",
-                    request_ref=getattr(e, "request_ref", uuid.uuid4().hex),
-                    provider_response={"error": str(e), "status_code": getattr(e, "status_code", None)},
-                )
+            Mandate.objects.create(
+                user=user,
+                rules_engine=rules_engine,
+                status="FAILED",
+                request_ref=getattr(e, "request_ref", None) or token_hex(16),
+                provider_response={"error": str(e), "status_code": getattr(e, "status_code", None)},
+            )
 
             return Response(
                 {"message": "Failed to contact OnePipe", "details": str(e)},
@@ -987,7 +1113,13 @@ class MandatesMeView(APIView):
     permission_classes = (IsAuthenticated,)
 
     def get(self, request):
-        mandate = Mandate.objects.filter(user=request.user).order_by("-created_at").first()
+        # Served by the (user, -created_at) index; the provider/cancel JSON
+        # blobs stay in the database, only their response codes are read
+        mandate = (
+            MandateSerializer.with_response_codes(Mandate.objects.filter(user=request.user))
+            .order_by("-created_at")
+            .first()
+        )
         if not mandate:
             return Response({"error": "No mandate found for this user."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -1006,8 +1138,15 @@ class CancelMandateView(APIView):
         user = serializer.validated_data["user"]
         profile = serializer.validated_data["profile"]
 
-        # Find latest ACTIVE mandate
-        mandate = Mandate.objects.filter(user=user, status="ACTIVE").order_by("-created_at").first()
+        # Find latest ACTIVE mandate (user, status index). Only the columns the
+        # cancel payload reads are loaded; the writeback below uses update_fields,
+        # so the provider_response blob is never fetched
+        mandate = (
+            Mandate.objects.filter(user=user, status="ACTIVE")
+            .only("id", "mandate_reference", "payment_id")
+            .order_by("-created_at")
+            .first()
+        )
         if not mandate:
             return Response({"error": "No active mandate to cancel"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -1034,15 +1173,15 @@ class CancelMandateView(APIView):
             if success:
                 mandate.status = "CANCELLED"
                 mandate.cancelled_at = timezone.now()
-                mandate.save()
+                mandate.save(update_fields=["cancel_response", "status", "cancelled_at", "updated_at"])
                 return Response({"message": "Mandate cancelled", "mandate_status": "CANCELLED"}, status=status.HTTP_200_OK)
             else:
                 # keep mandate ACTIVE, but store cancel_response for audit
-                mandate.save()
+                mandate.save(update_fields=["cancel_response", "updated_at"])
                 return Response({"message": "Provider cancellation failed", "provider_response": response}, status=status.HTTP_400_BAD_REQUEST)
 
         except OnePipeError as e:
             mandate.cancel_response = {"error": str(e), "status_code": getattr(e, "status_code", None)}
-            mandate.save()
+            mandate.save(update_fields=["cancel_response", "updated_at"])
             return Response({"message": "Failed to contact OnePipe", "details": str(e)}, status=status.HTTP_502_BAD_GATEWAY)
 
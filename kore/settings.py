@@ -173,6 +173,16 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # orjson-backed JSON; both fall back to DRF's stdlib json if orjson is missing
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "api.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 # OnePipe PayWithAccount Configuration
@@ -182,6 +192,8 @@ ONEPIPE = {
     "WEBHOOK_URL": os.getenv("ONEPIPE_WEBHOOK_URL", ""),
     "BASE_URL": os.getenv("ONEPIPE_BASE_URL", "https://api.dev.onepipe.io"),
     "TRANSACT_PATH": os.getenv("ONEPIPE_TRANSACT_PATH", "/v2/transact"),
+    # Request signature hash: "md5" (OnePipe default) or "blake2b" if negotiated
+    "SIGNATURE_ALG": os.getenv("ONEPIPE_SIGNATURE_ALG", "md5"),
 }
 
 #ok
@@ -0,0 +1,26 @@
+"""
+Lightweight Django settings for DB-free test modules.
+
+Used for SimpleTestCase-only modules (test_money.py, test_onepipe_utils.py)
+so they skip loading admin/sessions/DRF and don't need a database.
+
+Usage:
+    pytest --ds=kore.settings_light api/test_money.py api/test_onepipe_utils.py
+"""
+
+SECRET_KEY = "test-settings-light-not-for-production"
+
+DEBUG = False
+
+INSTALLED_APPS = [
+    "django.contrib.contenttypes",
+    "django.contrib.auth",
+    "api",
+]
+
+# No database: SimpleTestCase modules must not issue queries
+DATABASES = {}
+
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+USE_TZ = True
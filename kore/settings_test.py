@@ -0,0 +1,47 @@
+"""
+Django settings for running the kore test suite.
+
+Extends kore.settings with test-only overrides. Selected by pytest.ini;
+for the Django runner use:
+    python manage.py test api --settings=kore.settings_test
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+
+# Give each pytest-xdist worker its own named in-memory cache so tests that
+# call cache.clear() (profile submit, webhooks) never share state across workers.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "kore-test-{}".format(os.environ.get("PYTEST_XDIST_WORKER", "gw0")),
+    }
+}
+
+# Password hashing has no security value in tests; MD5 makes create_user cheap
+PASSWORD_HASHERS = (
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+)
+
+# In-memory SQLite: no DATABASE_URL needed and no fsync on test INSERTs.
+# Each xdist worker is its own process and so gets its own private test
+# database; --reuse-db is a no-op here since there is nothing on disk to keep.
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"NAME": ":memory:"},
+    }
+}
+
+# Tests talk plain HTTP through the test client
+SECURE_SSL_REDIRECT = False
+
+# Encryption and OnePipeClient need credentials; fall back to dummies so the
+# suite runs without a .env (requests to OnePipe are always mocked).
+ONEPIPE = {
+    **ONEPIPE,
+    "API_KEY": ONEPIPE.get("API_KEY") or "test-api-key",
+    "CLIENT_SECRET": ONEPIPE.get("CLIENT_SECRET") or "test-client-secret",
+}
@@ -6,7 +6,8 @@ Usage:
   python scripts/api_client.py login --email user@example.com --password secret
 
 It reads BASE_URL from environment or defaults to http://localhost:8000/api/.
-Prints JSON responses to stdout.
+Prints JSON responses to stdout, indented; pass --no-pretty (before the
+subcommand) to print the body exactly as received.
 
 Note: Username is auto-generated from email and not required for signup.
 """
@@ -19,7 +20,20 @@ import json
 BASE_URL = os.environ.get("API_BASE_URL", "http://localhost:8000/api/")
 
 
-def signup(email, full_name, password):
+def print_response(resp, pretty=True):
+    """Print the response body, indented when `pretty` and the body is JSON."""
+    if not pretty:
+        print(resp.text)
+        return
+    try:
+        data = resp.json()
+    except Exception:
+        print(resp.text)
+        return
+    print(json.dumps(data, indent=2))
+
+
+def signup(email, full_name, password, pretty=True):
     url = BASE_URL.rstrip("/") + "/auth/signup/"
     payload = {
         "full_name": full_name,
@@ -28,26 +42,22 @@ def signup(email, full_name, password):
         "confirm_password": password,
     }
     resp = requests.post(url, json=payload, timeout=10)
-    try:
-        print(json.dumps(resp.json(), indent=2))
-    except Exception:
-        print(resp.text)
+    print_response(resp, pretty)
     return resp
 
 
-def login(email, password):
+def login(email, password, pretty=True):
     url = BASE_URL.rstrip("/") + "/auth/login/"
     payload = {"email": email, "password": password}
     resp = requests.post(url, json=payload, timeout=10)
-    try:
-        print(json.dumps(resp.json(), indent=2))
-    except Exception:
-        print(resp.text)
+    print_response(resp, pretty)
     return resp
 
 
 def main(argv):
     parser = argparse.ArgumentParser(prog="api_client")
+    parser.add_argument("--no-pretty", dest="pretty", action="store_false",
+                        help="print response bodies as received")
     sub = parser.add_subparsers(dest="cmd")
 
     p_signup = sub.add_parser("signup")
@@ -61,9 +71,9 @@ def main(argv):
 
     args = parser.parse_args(argv)
     if args.cmd == "signup":
-        return signup(args.email, args.full_name, args.password)
+        return signup(args.email, args.full_name, args.password, args.pretty)
     if args.cmd == "login":
-        return login(args.email, args.password)
+        return login(args.email, args.password, args.pretty)
 
     parser.print_help()
     return None
@@ -0,0 +1,29 @@
+"""
+Shared pytest setup for the test modules in scripts/.
+
+pytest.ini puts the project root on sys.path and pytest-django sets Django up
+once for the whole session (DJANGO_SETTINGS_MODULE = kore.settings_test), so
+the pytest modules here need no sys.path / django.setup() preamble of their
+own.
+"""
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+
+# Hashed once per session; the fixture user only needs to exist as a foreign key
+PASSWORD_HASH = make_password("TestPass123!")
+
+
+@pytest.fixture(scope="module")
+def user(django_db_setup, django_db_blocker):
+    """One user for every test in a module, created outside the per-test transaction"""
+    with django_db_blocker.unblock():
+        user = User.objects.create(
+            username="test@example.com",
+            email="test@example.com",
+            first_name="Test",
+            password=PASSWORD_HASH
+        )
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
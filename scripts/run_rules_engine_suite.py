@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+Run all rules-engine endpoint tests in one process.
+
+Django is set up and the test database created once for the create, detail
+and update/disable modules, instead of once per script:
+    python scripts/run_rules_engine_suite.py
+
+pytest does the same when given the modules together (and can spread them
+across cores with -n auto); this file is not collected by pytest itself.
+"""
+import os
+import sys
+import django
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Project root for kore/api, scripts dir so the test modules import by name
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+sys.path.insert(0, SCRIPTS_DIR)
+
+# In-memory SQLite, MD5 hashing and dummy OnePipe credentials (see kore/settings_test.py)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "kore.settings_test")
+django.setup()
+
+from django.conf import settings
+from django.test.utils import get_runner
+
+MODULES = [
+    "test_rules_engine_endpoint",
+    "test_rules_engine_detail_endpoint",
+    "test_rules_engine_update_disable_endpoint",
+]
+
+
+if __name__ == "__main__":
+    # keepdb: create the test database once and reuse it on later runs
+    TestRunner = get_runner(settings)
+    failures = TestRunner(keepdb=True, verbosity=1).run_tests(MODULES)
+    sys.exit(bool(failures))
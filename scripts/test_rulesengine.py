@@ -1,85 +1,84 @@
 #!/usr/bin/env python
 """
-Test script to verify RulesEngine model functionality.
+Tests for the RulesEngine model: one active rule per user, date validation
+and the frequency / failure-action choices.
+
+The fixture user (conftest.py) is created once for the module; each test runs in a
+transaction rolled back at teardown, so rules never leak between tests:
+    pytest scripts/test_rulesengine.py
+Running the file directly does the same through pytest.main().
 """
-import os
 import sys
-import django
+from datetime import date, timedelta
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
-from datetime import date, timedelta
+if __name__ == "__main__":
+    # Run through pytest, which sets Django up from pytest.ini (see conftest.py)
+    sys.exit(pytest.main([__file__]))
 
-os.environ['DJANGO_SETTINGS_MODULE'] = 'kore.settings'
-django.setup()
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Q
 
-from django.contrib.auth.models import User
 from api.models import RulesEngine
-from django.core.exceptions import ValidationError
 
-def test_rulesengine_model():
-    print("\n" + "="*60)
-    print("Testing RulesEngine Model")
-    print("="*60)
-    
-    # Clean up
-    User.objects.all().delete()
-    RulesEngine.objects.all().delete()
-    
-    # Create test user
-    user = User.objects.create_user(
-        username="test@example.com",
-        email="test@example.com",
-        first_name="Test",
-        password="TestPass123!"
-    )
-    print(f"\n✓ Created test user: {user.email}")
-    
-    # Test 1: Create a basic rule
-    print("\n[Test 1] Create a basic RulesEngine...")
-    rule1 = RulesEngine.objects.create(
-        user=user,
-        monthly_max_debit=50000.00,
-        single_max_debit=10000.00,
-        frequency="MONTHLY",
-        amount_per_frequency=50000.00,
-        allocations=[
+pytestmark = pytest.mark.django_db
+
+
+def make_rule(user, **overrides):
+    fields = {
+        "user": user,
+        "monthly_max_debit": 50000.00,
+        "single_max_debit": 10000.00,
+        "frequency": "MONTHLY",
+        "amount_per_frequency": 50000.00,
+        "allocations": [
             {"bucket": "SAVINGS", "percentage": 50},
             {"bucket": "SPENDING", "percentage": 50}
         ],
-        failure_action="NOTIFY",
-        start_date=date.today(),
-        is_active=True
-    )
-    print(f"✓ Created rule: {rule1}")
-    print(f"  Monthly max: {rule1.monthly_max_debit}")
-    print(f"  Single max: {rule1.single_max_debit}")
-    print(f"  Frequency: {rule1.frequency}")
-    print(f"  Allocations: {rule1.allocations}")
-    
-    # Test 2: Verify only one active rule per user
-    print("\n[Test 2] Verify only one active rule per user...")
-    try:
-        rule2 = RulesEngine(
-            user=user,
+        "failure_action": "NOTIFY",
+        "start_date": date.today(),
+        "is_active": True,
+    }
+    fields.update(overrides)
+    return RulesEngine.objects.create(**fields)
+
+
+def test_basic_rule(user):
+    """A rule is stored with the limits and allocations it was given"""
+    rule = make_rule(user)
+    rule.refresh_from_db()
+
+    assert rule.monthly_max_debit == 50000
+    assert rule.single_max_debit == 10000
+    assert rule.frequency == "MONTHLY"
+    assert rule.allocations == [
+        {"bucket": "SAVINGS", "percentage": 50},
+        {"bucket": "SPENDING", "percentage": 50}
+    ]
+
+
+def test_duplicate_active_rule_rejected(user):
+    """Only one active rule per user"""
+    make_rule(user)
+
+    with pytest.raises(ValidationError):
+        make_rule(
+            user,
             monthly_max_debit=30000.00,
             single_max_debit=5000.00,
             frequency="WEEKLY",
             amount_per_frequency=7000.00,
             failure_action="SKIP",
-            start_date=date.today(),
-            is_active=True
         )
-        rule2.save()
-        print("✗ FAILED: Should have prevented second active rule!")
-    except ValidationError as e:
-        print(f"✓ Correctly prevented duplicate active rule: {e.message}")
-    
-    # Test 3: Allow multiple inactive rules
-    print("\n[Test 3] Allow inactive rules for same user...")
-    rule3 = RulesEngine.objects.create(
-        user=user,
+
+
+def test_inactive_rule_allowed_alongside_active(user):
+    """Inactive rules don't count against the one-active-rule limit"""
+    make_rule(user)
+
+    rule = make_rule(
+        user,
         monthly_max_debit=20000.00,
         single_max_debit=3000.00,
         frequency="DAILY",
@@ -88,57 +87,40 @@ def test_rulesengine_model():
         start_date=date.today() + timedelta(days=30),
         is_active=False
     )
-    print(f"✓ Created inactive rule: {rule3}")
-    
-    # Test 4: Verify date validation
-    print("\n[Test 4] Verify date validation...")
-    try:
-        invalid_rule = RulesEngine(
-            user=user,
+
+    assert rule.pk is not None
+
+
+def test_end_date_before_start_date_rejected(user):
+    """end_date cannot precede start_date"""
+    with pytest.raises(ValidationError):
+        make_rule(
+            user,
             monthly_max_debit=25000.00,
             single_max_debit=5000.00,
-            frequency="MONTHLY",
             amount_per_frequency=25000.00,
-            failure_action="NOTIFY",
-            start_date=date.today(),
             end_date=date.today() - timedelta(days=1),  # End date before start date
             is_active=False
         )
-        invalid_rule.save()
-        print("✗ FAILED: Should have rejected end_date before start_date!")
-    except ValidationError as e:
-        print(f"✓ Correctly rejected invalid date range: {e.message}")
-    
-    # Test 5: Verify rule counts
-    print("\n[Test 5] Verify rule counts...")
-    user_rules = RulesEngine.objects.filter(user=user)
-    active_rules = user_rules.filter(is_active=True)
-    print(f"✓ Total rules for user: {user_rules.count()}")
-    print(f"✓ Active rules for user: {active_rules.count()}")
-    assert user_rules.count() == 2, "Expected 2 total rules"
-    assert active_rules.count() == 1, "Expected 1 active rule"
-    
-    # Test 6: Verify frequency choices
-    print("\n[Test 6] Verify frequency choices...")
-    frequencies = dict(RulesEngine.FREQUENCY_CHOICES)
-    print(f"✓ Available frequencies: {list(frequencies.keys())}")
-    
-    # Test 7: Verify failure action choices
-    print("\n[Test 7] Verify failure action choices...")
-    actions = dict(RulesEngine.FAILURE_ACTION_CHOICES)
-    print(f"✓ Available failure actions: {list(actions.keys())}")
-    
-    # Summary
-    print("\n" + "="*60)
-    print("✓ All RulesEngine tests passed!")
-    print("="*60 + "\n")
 
 
-if __name__ == "__main__":
-    try:
-        test_rulesengine_model()
-    except Exception as e:
-        print(f"\n✗ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+def test_rule_counts(user):
+    """One active and one inactive rule give two rules, one of them active"""
+    make_rule(user)
+    make_rule(user, frequency="DAILY", is_active=False)
+
+    # Both counts in one query
+    counts = RulesEngine.objects.filter(user=user).aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(is_active=True)),
+    )
+    assert counts == {"total": 2, "active": 1}, counts
+
+
+def test_frequency_choices():
+    assert [key for key, _ in RulesEngine.FREQUENCY_CHOICES] == ["DAILY", "WEEKLY", "MONTHLY", "CUSTOM"]
+
+
+def test_failure_action_choices():
+    assert [key for key, _ in RulesEngine.FAILURE_ACTION_CHOICES] == ["RETRY", "SKIP", "NOTIFY"]
+
@@ -1,50 +1,38 @@
 #!/usr/bin/env python
 """
-Simple test to verify signal works when creating a user directly.
+Verify the auto-profile signal fires when a user is created directly.
+
+Runs in a transaction rolled back at teardown, so it can share a run (and an
+xdist worker's database) with the other modules here:
+    pytest -n auto --dist=loadscope scripts/
 """
-import os
 import sys
-import django
 
-# Setup Django
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'kore.settings')
-django.setup()
+import pytest
+
+if __name__ == "__main__":
+    # Run through pytest, which sets Django up from pytest.ini (see conftest.py)
+    sys.exit(pytest.main([__file__]))
 
 from django.contrib.auth import get_user_model
+
 from api.models import Profile
 
 User = get_user_model()
 
-print("\n" + "="*60)
-print("Testing auto-profile signal...")
-print("="*60)
-
-email = "test.signal.direct@example.com"
-
-# Clean up
-User.objects.filter(email=email).delete()
-
-print(f"\nCreating user with email: {email}")
-user = User.objects.create_user(
-    username=email,
-    email=email,
-    first_name="Test",
-    password="TestPassword123!"
-)
-print(f"✓ User created: {user.username} (ID: {user.id})")
-
-# Check profile
-profile_count = Profile.objects.filter(user=user).count()
-print(f"\nProfile count for this user: {profile_count}")
-
-if profile_count > 0:
-    profile = Profile.objects.get(user=user)
-    print(f"✓ SUCCESS: Profile auto-created!")
-    print(f"  Profile ID: {profile.id}")
-    print(f"  Profile User: {profile.user.username}")
-else:
-    print(f"✗ FAILED: Profile NOT auto-created")
-    print(f"  Expected 1 profile, found {profile_count}")
-
-print("\n" + "="*60)
+
+@pytest.mark.django_db
+def test_profile_created_with_user():
+    email = "test.signal.direct@example.com"
+    user = User.objects.create_user(
+        username=email,
+        email=email,
+        first_name="Test",
+        password="TestPassword123!"
+    )
+
+    # One query, with the user joined in for the username check
+    profile = Profile.objects.select_related("user").filter(user=user).first()
+
+    assert profile is not None, "Profile NOT auto-created"
+    assert profile.user.username == email
@@ -8,13 +8,13 @@ Verifies:
 - No errors on typical inputs
 """
 
-import os
 import sys
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "kore.settings")
+if __name__ == "__main__":
+    # Run through pytest, which puts the project root on sys.path (pytest.ini)
+    sys.exit(pytest.main([__file__]))
 
 from api.triple_des import derive_3des_key, triple_des_encrypt, triple_des_decrypt
 
@@ -28,8 +28,6 @@ def test_key_derivation_deterministic():
     
     assert key1 == key2, "Key derivation not deterministic"
     assert len(key1) == 24, f"Key length should be 24, got {len(key1)}"
-    
-    print("✓ Key derivation is deterministic and correct length (24 bytes)")
 
 
 def test_encryption_stable():
@@ -42,47 +40,20 @@ def test_encryption_stable():
     
     assert ciphertext1 == ciphertext2, "Encryption not stable"
     assert ciphertext1, "Ciphertext should not be empty"
-    
-    print(f"✓ Encryption is stable: '{plaintext}' -> '{ciphertext1}'")
 
 
-def test_roundtrip_decrypt():
+@pytest.mark.parametrize("secret,plaintext", [
+    ("MySecretKey123", "Hello, OnePipe!"),
+    ("VeryLongSecretKey", "This is a longer message with special chars: !@#$%^&*()_+-=[]{}|;:',.<>?/~`"),
+    # UTF-16LE encoded special chars
+    ("UTF16Secret", "Special: é à ñ ü 中文 日本語"),
+], ids=["short", "long_text", "utf16_chars"])
+def test_roundtrip(secret, plaintext):
     """Encrypted text should decrypt back to original"""
-    secret = "MySecretKey123"
-    plaintext = "Hello, OnePipe!"
-    
     ciphertext = triple_des_encrypt(plaintext, secret)
     decrypted = triple_des_decrypt(ciphertext, secret)
     
     assert decrypted == plaintext, f"Roundtrip failed: {plaintext} != {decrypted}"
-    
-    print(f"✓ Roundtrip successful: '{plaintext}' -> [encrypted] -> '{decrypted}'")
-
-
-def test_roundtrip_long_text():
-    """Long plaintext should also roundtrip correctly"""
-    secret = "VeryLongSecretKey"
-    plaintext = "This is a longer message with special chars: !@#$%^&*()_+-=[]{}|;:',.<>?/~`"
-    
-    ciphertext = triple_des_encrypt(plaintext, secret)
-    decrypted = triple_des_decrypt(ciphertext, secret)
-    
-    assert decrypted == plaintext, f"Long text roundtrip failed"
-    
-    print(f"✓ Long text roundtrip successful ({len(plaintext)} chars)")
-
-
-def test_roundtrip_utf16_chars():
-    """UTF-16LE encoded special chars should roundtrip"""
-    secret = "UTF16Secret"
-    plaintext = "Special: é à ñ ü 中文 日本語"
-    
-    ciphertext = triple_des_encrypt(plaintext, secret)
-    decrypted = triple_des_decrypt(ciphertext, secret)
-    
-    assert decrypted == plaintext, f"UTF-16 roundtrip failed"
-    
-    print(f"✓ UTF-16 special chars roundtrip successful")
 
 
 def test_different_secrets_produce_different_ciphertexts():
@@ -93,8 +64,6 @@ def test_different_secrets_produce_different_ciphertexts():
     ciphertext2 = triple_des_encrypt(plaintext, "Secret2")
     
     assert ciphertext1 != ciphertext2, "Different secrets should produce different ciphertexts"
-    
-    print("✓ Different secrets produce different ciphertexts")
 
 
 def test_different_plaintexts_produce_different_ciphertexts():
@@ -105,8 +74,6 @@ def test_different_plaintexts_produce_different_ciphertexts():
     ciphertext2 = triple_des_encrypt("PlainText2", secret)
     
     assert ciphertext1 != ciphertext2, "Different plaintexts should produce different ciphertexts"
-    
-    print("✓ Different plaintexts produce different ciphertexts")
 
 
 def test_base64_output():
@@ -124,8 +91,6 @@ def test_base64_output():
         assert len(decoded_bytes) > 0, "Decoded bytes should not be empty"
     except Exception as e:
         raise AssertionError(f"Output is not valid base64: {e}")
-    
-    print(f"✓ Output is valid base64 (length: {len(ciphertext)} chars)")
 
 
 def test_no_error_on_typical_inputs():
@@ -141,8 +106,6 @@ def test_no_error_on_typical_inputs():
     account = "1234567890"
     ciphertext_account = triple_des_encrypt(account, secret)
     assert ciphertext_account, "Account encryption should not be empty"
-    
-    print("✓ Handles typical BVN and account inputs without error")
 
 
 def test_snapshot_consistency():
@@ -165,50 +128,4 @@ def test_snapshot_consistency():
     # Verify roundtrip
     decrypted = triple_des_decrypt(ciphertext, secret)
     assert decrypted == plaintext, f"Snapshot roundtrip failed: {plaintext} != {decrypted}"
-    
-    print(f"✓ Snapshot test passed: '{plaintext}' encrypts to stable output")
-
 
-if __name__ == "__main__":
-    try:
-        print("[Test 1] Key derivation deterministic...")
-        test_key_derivation_deterministic()
-        
-        print("\n[Test 2] Encryption is stable...")
-        test_encryption_stable()
-        
-        print("\n[Test 3] Roundtrip encrypt/decrypt...")
-        test_roundtrip_decrypt()
-        
-        print("\n[Test 4] Long text roundtrip...")
-        test_roundtrip_long_text()
-        
-        print("\n[Test 5] UTF-16 special chars roundtrip...")
-        test_roundtrip_utf16_chars()
-        
-        print("\n[Test 6] Different secrets produce different outputs...")
-        test_different_secrets_produce_different_ciphertexts()
-        
-        print("\n[Test 7] Different plaintexts produce different outputs...")
-        test_different_plaintexts_produce_different_ciphertexts()
-        
-        print("\n[Test 8] Base64 output validation...")
-        test_base64_output()
-        
-        print("\n[Test 9] Handles typical inputs...")
-        test_no_error_on_typical_inputs()
-        
-        print("\n[Test 10] Snapshot consistency...")
-        test_snapshot_consistency()
-        
-        print("\n" + "=" * 70)
-        print("✓ All TripleDES encryption tests passed!")
-        print("=" * 70)
-    except AssertionError as e:
-        print(f"\n✗ Test failed: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)